@@ -0,0 +1,45 @@
+"""In-memory TTL cache shared by the API client and the MCP tools."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+
+class TTLCache:
+    """Bounded mapping whose entries expire ``ttl`` seconds after being set.
+
+    Once ``maxsize`` entries are stored the oldest is evicted (FIFO).
+    Expired entries are dropped lazily when read. ``None`` is reserved to
+    signal a miss, so it cannot be cached.
+    """
+
+    def __init__(self, ttl: float, maxsize: int) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value for ``key``, or ``None`` if absent or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._data[key]
+            return None
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        """Store ``value`` under ``key`` for ``ttl`` seconds (default: ``self.ttl``)."""
+        self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -2,12 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import math
 import os
 import time
 from typing import Any
 
 import httpx
 
+from .cache import TTLCache
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speed-up
+    orjson = None
+
 REGION_BASE_URLS = {
     "eu-west-1": "https://api2-eu-west-1.insided.com",
     "us-west-2": "https://api2-us-west-2.insided.com",
@@ -15,6 +25,22 @@ REGION_BASE_URLS = {
 
 TOKEN_PATH = "/oauth2/token"
 
+# Tokens are refreshed this long before they expire, or halfway through
+# their lifetime if they live for less than twice this buffer
+TOKEN_REFRESH_BUFFER = 60.0
+# Floor on the background refresh interval, in case the IdP issues tokens
+# with no usable lifetime at all
+TOKEN_REFRESH_MIN_INTERVAL = 1.0
+
+# Concurrent tool calls are multiplexed over a single HTTP/2 connection;
+# keep idle connections around long enough to survive gaps between calls.
+HTTP_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+HTTP_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=50,
+    keepalive_expiry=60.0,
+)
+
 # Maps content type names to their API path segments
 CONTENT_TYPE_PATHS = {
     "article": "articles",
@@ -24,6 +50,60 @@ CONTENT_TYPE_PATHS = {
     "productUpdate": "productUpdates",
 }
 
+# Precomputed collection paths, e.g. "question" -> "/v2/questions"
+_CONTENT_TYPE_BASE_PATHS = {
+    content_type: f"/v2/{segment}"
+    for content_type, segment in CONTENT_TYPE_PATHS.items()
+}
+
+# Listed in "Unknown content type" errors raised here and returned by server tools
+SUPPORTED_CONTENT_TYPES = ", ".join(CONTENT_TYPE_PATHS)
+
+
+def _resolve_content_type(content_type: str) -> str:
+    """Return the collection path for ``content_type`` (e.g. ``/v2/questions``)."""
+    try:
+        return _CONTENT_TYPE_BASE_PATHS[content_type]
+    except KeyError:
+        raise ValueError(
+            f"Unknown content type '{content_type}'. "
+            f"Supported: {SUPPORTED_CONTENT_TYPES}"
+        ) from None
+
+
+# The API's page size when pageSize is not sent
+DEFAULT_PAGE_SIZE = 25
+
+# Low-churn reference data (categories, tags, statuses) is cached in memory
+CACHE_TTL = 300.0
+CACHE_MAX_ENTRIES = 128
+
+# One connection pool per API base URL, shared by every GainsightClient in
+# the process so new instances reuse warm TLS connections.
+_http_clients: dict[str, httpx.AsyncClient] = {}
+
+
+def _get_http_client(base_url: str) -> httpx.AsyncClient:
+    """Return the shared AsyncClient for base_url, creating it on first use."""
+    http = _http_clients.get(base_url)
+    if http is None or http.is_closed:
+        http = httpx.AsyncClient(
+            base_url=base_url,
+            http2=True,
+            timeout=HTTP_TIMEOUT,
+            limits=HTTP_LIMITS,
+        )
+        _http_clients[base_url] = http
+    return http
+
+
+async def aclose_http_clients() -> None:
+    """Close every shared AsyncClient.  Call once on process shutdown."""
+    clients = list(_http_clients.values())
+    _http_clients.clear()
+    for http in clients:
+        await http.aclose()
+
 
 class GainsightClient:
     """Async client for the Gainsight Customer Communities API using OAuth2."""
@@ -48,14 +128,34 @@ class GainsightClient:
 
         self.base_url = REGION_BASE_URLS[self.region]
         self._access_token: str | None = None
-        self._token_expires_at: float = 0
-        self._http = httpx.AsyncClient(base_url=self.base_url, timeout=30.0)
+        # Rebuilt only when the token changes, then reused for every request
+        self._auth_headers: dict[str, str] = {}
+        self._token_expires_at: float = 0.0
+        self._token_lock = asyncio.Lock()
+        self._refresh_task: asyncio.Task[None] | None = None
+        self._cache = TTLCache(CACHE_TTL, CACHE_MAX_ENTRIES)
+        self._http = _get_http_client(self.base_url)
 
     async def _ensure_token(self) -> None:
-        """Obtain or refresh the OAuth2 access token."""
-        if self._access_token and time.time() < self._token_expires_at:
+        """Obtain the first OAuth2 access token and start background refresh.
+
+        Once a token exists, ``_refresh_loop`` keeps it fresh, so the hot
+        path is a single attribute check.
+        """
+        if self._access_token is not None:
             return
 
+        async with self._token_lock:
+            # Another coroutine may have fetched a token while we waited
+            if self._access_token is not None:
+                return
+            await self._fetch_token()
+
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def _fetch_token(self) -> None:
+        """Request a new access token.  Callers must hold ``_token_lock``."""
         resp = await self._http.post(
             TOKEN_PATH,
             data={
@@ -68,8 +168,35 @@ class GainsightClient:
         resp.raise_for_status()
         data = resp.json()
         self._access_token = data["access_token"]
-        # Refresh 60 s before actual expiry
-        self._token_expires_at = time.time() + data.get("expires_in", 3600) - 60
+        self._auth_headers = {"Authorization": f"Bearer {self._access_token}"}
+        expires_in = data.get("expires_in", 3600)
+        # Refresh shortly before actual expiry, but never more often than
+        # every half lifetime, so short-lived tokens don't spin the loop
+        self._token_expires_at = time.monotonic() + max(
+            expires_in - TOKEN_REFRESH_BUFFER,
+            expires_in / 2,
+            TOKEN_REFRESH_MIN_INTERVAL,
+        )
+
+    async def _force_refresh(self, stale_token: str | None) -> None:
+        """Replace ``stale_token`` unless another coroutine already has."""
+        async with self._token_lock:
+            if self._access_token == stale_token:
+                await self._fetch_token()
+
+    async def _refresh_loop(self) -> None:
+        """Refresh the token shortly before it expires until cancelled."""
+        while True:
+            await asyncio.sleep(max(self._token_expires_at - time.monotonic(), 0))
+            try:
+                async with self._token_lock:
+                    await self._fetch_token()
+            except (httpx.HTTPError, KeyError, ValueError):
+                # Network error, error status or malformed token body: fall
+                # back to fetching a token on the next request
+                self._access_token = None
+                self._auth_headers = {}
+                return
 
     async def _request(
         self,
@@ -79,18 +206,83 @@ class GainsightClient:
         params: dict[str, Any] | None = None,
     ) -> Any:
         await self._ensure_token()
+        token = self._access_token
         resp = await self._http.request(
-            method,
-            path,
-            params=params,
-            headers={
-                "Authorization": f"Bearer {self._access_token}",
-                "Accept": "*/*",
-            },
+            method, path, params=params, headers=self._auth_headers
         )
+        if resp.status_code == 401:
+            # Token was revoked or expired early; refresh once and retry
+            await self._force_refresh(token)
+            resp = await self._http.request(
+                method, path, params=params, headers=self._auth_headers
+            )
         resp.raise_for_status()
+        if orjson is not None:
+            return orjson.loads(resp.content)
         return resp.json()
 
+    async def _cached_request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        ttl: float | None = None,
+        cache: bool = True,
+    ) -> Any:
+        """Like ``_request`` but memoised for ``ttl`` seconds (default ``CACHE_TTL``).
+
+        Only use for idempotent endpoints whose data changes rarely. Cached
+        responses are shared between callers and must not be mutated.
+        ``cache=False`` skips this cache entirely, for callers that keep
+        their own copy and would otherwise stack two TTLs.
+        """
+        if not cache:
+            return await self._request(method, path, params=params)
+        key = (method, path, frozenset(params.items()) if params else None)
+        data = self._cache.get(key)
+        if data is None:
+            data = await self._request(method, path, params=params)
+            self._cache.set(key, data, ttl)
+        return data
+
+    async def paginate(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        *,
+        max_pages: int = 10,
+    ) -> Any:
+        """Fetch up to ``max_pages`` pages of a list endpoint.
+
+        Page 1 is requested first to read ``_metadata.totalCount``; the
+        remaining pages are then fetched concurrently and their ``result``
+        arrays concatenated in page order.
+        """
+        params = {k: v for k, v in (params or {}).items() if k != "page"}
+        first = await self._request("GET", path, params={**params, "page": 1})
+        metadata = first.get("_metadata") or {}
+        total = metadata.get("totalCount")
+        page_size = metadata.get("limit") or params.get("pageSize") or DEFAULT_PAGE_SIZE
+        if not total:
+            return first
+
+        page_count = min(math.ceil(total / page_size), max_pages)
+        rest = await asyncio.gather(
+            *(
+                self._request("GET", path, params={**params, "page": page})
+                for page in range(2, page_count + 1)
+            )
+        )
+        results = list(first.get("result", []))
+        for page in rest:
+            results.extend(page.get("result", []))
+        return {"result": results, "_metadata": metadata}
+
+    def clear_cache(self) -> None:
+        """Drop all cached responses."""
+        self._cache.clear()
+
     # ---- public API methods ----
 
     async def search(self, params: dict[str, Any]) -> Any:
@@ -109,6 +301,12 @@ class GainsightClient:
         """List all topics.  GET /v2/topics"""
         return await self._request("GET", "/v2/topics", params=params)
 
+    async def list_all_topics(
+        self, params: dict[str, Any], *, max_pages: int = 10
+    ) -> Any:
+        """List topics across several pages.  GET /v2/topics?page=1..N"""
+        return await self.paginate("/v2/topics", params, max_pages=max_pages)
+
     async def list_questions(self, params: dict[str, Any]) -> Any:
         """List questions.  GET /v2/questions"""
         return await self._request("GET", "/v2/questions", params=params)
@@ -134,13 +332,8 @@ class GainsightClient:
 
         GET /v2/{contentTypes}/{id}  (e.g. /v2/questions/42)
         """
-        path_segment = CONTENT_TYPE_PATHS.get(content_type)
-        if not path_segment:
-            raise ValueError(
-                f"Unknown content type '{content_type}'. "
-                f"Supported: {', '.join(CONTENT_TYPE_PATHS)}"
-            )
-        return await self._request("GET", f"/v2/{path_segment}/{topic_id}")
+        base_path = _resolve_content_type(content_type)
+        return await self._request("GET", f"{base_path}/{topic_id}")
 
     async def get_topic_replies(
         self, content_type: str, topic_id: int, params: dict[str, Any] | None = None
@@ -149,39 +342,57 @@ class GainsightClient:
 
         GET /v2/{contentTypes}/{id}/replies
         """
-        path_segment = CONTENT_TYPE_PATHS.get(content_type)
-        if not path_segment:
-            raise ValueError(
-                f"Unknown content type '{content_type}'. "
-                f"Supported: {', '.join(CONTENT_TYPE_PATHS)}"
-            )
+        base_path = _resolve_content_type(content_type)
         return await self._request(
-            "GET", f"/v2/{path_segment}/{topic_id}/replies", params=params
+            "GET", f"{base_path}/{topic_id}/replies", params=params
         )
 
+    async def try_get_topic_replies(self, content_type: str, topic_id: int) -> Any:
+        """Get replies for a topic, or an empty page if the request fails.
+
+        Some topics have no replies endpoint; callers that only want to attach
+        replies when they exist use this instead of handling the error.
+        """
+        try:
+            return await self.get_topic_replies(content_type, topic_id)
+        except httpx.HTTPStatusError:
+            return {"result": [], "_metadata": {"totalCount": 0}}
+
     async def get_topic_by_id(self, topic_id: int) -> Any:
         """Look up a topic by ID (any content type).  GET /v2/topics?id={id}"""
         return await self._request("GET", "/v2/topics", params={"id": topic_id})
 
-    async def list_categories(self, params: dict[str, Any] | None = None) -> Any:
+    async def list_categories(
+        self, params: dict[str, Any] | None = None, *, cache: bool = True
+    ) -> Any:
         """List categories.  GET /v2/categories"""
-        return await self._request("GET", "/v2/categories", params=params)
+        return await self._cached_request(
+            "GET", "/v2/categories", params=params, cache=cache
+        )
 
-    async def list_tags(self, params: dict[str, Any] | None = None) -> Any:
+    async def list_tags(
+        self, params: dict[str, Any] | None = None, *, cache: bool = True
+    ) -> Any:
         """List tags.  GET /v2/tags"""
-        return await self._request("GET", "/v2/tags", params=params)
+        return await self._cached_request("GET", "/v2/tags", params=params, cache=cache)
 
-    async def list_moderator_tags(self, params: dict[str, Any] | None = None) -> Any:
+    async def list_moderator_tags(
+        self, params: dict[str, Any] | None = None, *, cache: bool = True
+    ) -> Any:
         """List moderator tags.  GET /v2/moderatorTags"""
-        return await self._request("GET", "/v2/moderatorTags", params=params)
+        return await self._cached_request(
+            "GET", "/v2/moderatorTags", params=params, cache=cache
+        )
 
-    async def get_category(self, category_id: int) -> Any:
+    async def get_category(self, category_id: int, *, cache: bool = True) -> Any:
         """Get a single category by ID.  GET /v2/categories/{id}"""
-        return await self._request("GET", f"/v2/categories/{category_id}")
+        return await self._cached_request(
+            "GET", f"/v2/categories/{category_id}", cache=cache
+        )
 
-    async def get_category_tree(self) -> Any:
+    async def get_category_tree(self, *, cache: bool = True) -> Any:
         """Get the full category hierarchy.  GET /v2/category/getTree"""
-        return await self._request("GET", "/v2/category/getTree")
+        return await self._cached_request("GET", "/v2/category/getTree", cache=cache)
 
     async def get_category_topic_counts(self) -> Any:
         """Get visible topic counts per category.  GET /v2/categories/getVisibleTopicsCount"""
@@ -195,37 +406,36 @@ class GainsightClient:
             "GET", f"/v2/categories/{category_id}/topics", params=params
         )
 
-    async def list_idea_statuses(self) -> Any:
+    async def list_idea_statuses(self, *, cache: bool = True) -> Any:
         """List idea statuses.  GET /v2/ideas/ideaStatuses"""
-        return await self._request("GET", "/v2/ideas/ideaStatuses")
+        return await self._cached_request("GET", "/v2/ideas/ideaStatuses", cache=cache)
 
-    async def list_product_areas(self) -> Any:
+    async def list_product_areas(self, *, cache: bool = True) -> Any:
         """List product areas.  GET /v2/productAreas"""
-        return await self._request("GET", "/v2/productAreas")
+        return await self._cached_request("GET", "/v2/productAreas", cache=cache)
 
     async def get_poll_results(self, content_type: str, topic_id: int) -> Any:
         """Get poll results for a topic.  GET /v2/{contentTypes}/{id}/poll"""
-        path_segment = CONTENT_TYPE_PATHS.get(content_type)
-        if not path_segment:
-            raise ValueError(
-                f"Unknown content type '{content_type}'. "
-                f"Supported: {', '.join(CONTENT_TYPE_PATHS)}"
-            )
-        return await self._request("GET", f"/v2/{path_segment}/{topic_id}/poll")
+        base_path = _resolve_content_type(content_type)
+        return await self._request("GET", f"{base_path}/{topic_id}/poll")
 
     async def get_reply(
         self, content_type: str, topic_id: int, reply_id: int
     ) -> Any:
         """Get a single reply by ID.  GET /v2/{contentTypes}/{id}/replies/{replyId}"""
-        path_segment = CONTENT_TYPE_PATHS.get(content_type)
-        if not path_segment:
-            raise ValueError(
-                f"Unknown content type '{content_type}'. "
-                f"Supported: {', '.join(CONTENT_TYPE_PATHS)}"
-            )
+        base_path = _resolve_content_type(content_type)
         return await self._request(
-            "GET", f"/v2/{path_segment}/{topic_id}/replies/{reply_id}"
+            "GET", f"{base_path}/{topic_id}/replies/{reply_id}"
         )
 
     async def close(self) -> None:
-        await self._http.aclose()
+        """Release per-instance resources.
+
+        The shared connection pool outlives individual clients and is closed
+        by ``aclose_http_clients()`` on shutdown.
+        """
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._refresh_task
+            self._refresh_task = None
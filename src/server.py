@@ -2,13 +2,53 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import json
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
 from typing import Any
 
 import httpx
 from mcp.server.fastmcp import FastMCP
 
-from .client import GainsightClient
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speed-up
+    orjson = None
+
+from .cache import TTLCache
+from .client import (
+    CONTENT_TYPE_PATHS,
+    SUPPORTED_CONTENT_TYPES,
+    GainsightClient,
+    aclose_http_clients,
+)
+
+_client: GainsightClient | None = None
+
+
+def _get_client() -> GainsightClient:
+    global _client
+    if _client is None:
+        _client = GainsightClient()
+    return _client
+
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Create the API client on startup and release it on shutdown."""
+    global _client
+    _get_client()
+    try:
+        yield
+    finally:
+        if _client is not None:
+            await _client.close()
+            _client = None
+        await aclose_http_clients()
+
 
 mcp = FastMCP(
     "Gainsight Customer Communities",
@@ -16,21 +56,130 @@ mcp = FastMCP(
         "Search and retrieve content from Gainsight Customer Communities "
         "(formerly inSided)."
     ),
+    lifespan=_lifespan,
 )
 
-_client: GainsightClient | None = None
 
+def _params(*pairs: tuple[str, Any]) -> dict[str, Any]:
+    """Build query params from ``(name, value)`` pairs, skipping ``None`` values.
 
-def _get_client() -> GainsightClient:
-    global _client
-    if _client is None:
-        _client = GainsightClient()
-    return _client
+    Most optional arguments are unset on a typical call, so only the params
+    actually sent are ever inserted into the dict.
+    """
+    return {key: value for key, value in pairs if value is not None}
+
+
+def _dumps(data: Any) -> str:
+    """Serialise a tool result to compact JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(data).decode()
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+
+def _err(message: str) -> str:
+    """Return ``{"error": message}`` as JSON without building the dict."""
+    return f'{{"error":{json.dumps(message, ensure_ascii=False)}}}'
+
+
+# Serialised output of discovery tools whose data changes on the order of
+# hours; a hit skips both the client call and re-serialisation. Misses
+# bypass the client's own response cache (cache=False), so an entry is
+# never older than its TTL.
+_TOOL_CACHE_TTL = 300.0
+_tool_cache = TTLCache(_TOOL_CACHE_TTL, maxsize=256)
+
+# Search results are kept longer: models tend to repeat the same query
+# several times while exploring, and results only drift slowly.
+_SEARCH_CACHE_TTL = 600.0
+
+
+async def _cached_result(
+    key: tuple[Any, ...],
+    fetch: Callable[..., Awaitable[Any]],
+    *args: Any,
+    ttl: float | None = None,
+) -> str:
+    """Return the cached JSON for ``key``, calling ``fetch(*args)`` on a miss."""
+    cached = _tool_cache.get(key)
+    if cached is None:
+        cached = _dumps(await fetch(*args))
+        _tool_cache.set(key, cached, ttl)
+    return cached
 
 
-def _clean(params: dict[str, Any]) -> dict[str, Any]:
-    """Remove None values so they are not sent as query params."""
-    return {k: v for k, v in params.items() if v is not None}
+def _date_range(start: str | None, end: str | None) -> str | None:
+    """Serialise a from/to date pair for the createdAt/lastActivity filters.
+
+    The API only accepts these as a JSON object in a single query param.
+    """
+    bounds = {}
+    if start:
+        bounds["from"] = start
+    if end:
+        bounds["to"] = end
+    return _dumps(bounds) if bounds else None
+
+
+# Content types of recently fetched topics, so repeat get_topic calls can
+# skip the lookup request. Bounded LRU: oldest entries are evicted first.
+_TOPIC_TYPE_CACHE_SIZE = 1024
+_topic_types: OrderedDict[int, str] = OrderedDict()
+
+
+def _remember_topic_type(topic_id: int, content_type: str) -> None:
+    _topic_types[topic_id] = content_type
+    _topic_types.move_to_end(topic_id)
+    if len(_topic_types) > _TOPIC_TYPE_CACHE_SIZE:
+        _topic_types.popitem(last=False)
+
+
+# Checked before calling the client so bad input from the model gets a
+# JSON error back instead of a raised exception
+_VALID_CONTENT_TYPES = frozenset(CONTENT_TYPE_PATHS)
+
+
+def _content_type_error(content_type: str) -> str:
+    return _err(
+        f"Unknown content type '{content_type}'. "
+        f"Supported: {SUPPORTED_CONTENT_TYPES}"
+    )
+
+
+# GainsightClient method used by list_topics for each content_type;
+# unknown types fall back to the unified list_topics endpoint
+_LIST_METHODS = {
+    "question": "list_questions",
+    "conversation": "list_conversations",
+    "article": "list_articles",
+    "idea": "list_ideas",
+    "productUpdate": "list_product_updates",
+}
+
+# Upper bound on pages fetched by a single list_topics_all or prefetch call
+_MAX_PAGES = 10
+
+
+async def _fetch_pages(
+    fetch: Callable[[dict[str, Any]], Awaitable[Any]],
+    params: dict[str, Any],
+    pages: int,
+) -> Any:
+    """Fetch ``pages`` consecutive pages concurrently and merge their results.
+
+    Starts at ``params["page"]`` (default 1). Metadata is taken from the
+    first page; pages past the end simply contribute no results.
+    """
+    start = params.get("page", 1)
+    pages = max(1, min(pages, _MAX_PAGES))
+    responses = await asyncio.gather(
+        *(fetch({**params, "page": page}) for page in range(start, start + pages))
+    )
+    merged: dict[str, Any] = {
+        "result": [item for response in responses for item in response.get("result", [])]
+    }
+    if "_metadata" in responses[0]:
+        merged["_metadata"] = responses[0]["_metadata"]
+    return merged
 
 
 _URL_KEYS = {"url", "seoCommunityUrl"}
@@ -56,7 +205,7 @@ def _resolve_urls(data: Any, community_url: str) -> Any:
 # ---------- Tools ----------
 
 
-@mcp.tool()
+@mcp.tool(structured_output=False)
 async def search_community(
     query: str,
     category_ids: str | None = None,
@@ -78,24 +227,30 @@ async def search_community(
         page: Page number for pagination (starts at 1).
     """
     client = _get_client()
-    params = _clean(
-        {
-            "q": query,
-            "categoryIds": category_ids,
-            "contentTypes": content_types,
-            "tags": tags,
-            "moderatorTags": moderator_tags,
-            "hasAnswer": has_answer,
-            "page": page,
-        }
+    params = _params(
+        ("q", query),
+        ("categoryIds", category_ids),
+        ("contentTypes", content_types),
+        ("tags", tags),
+        ("moderatorTags", moderator_tags),
+        ("hasAnswer", has_answer),
+        ("page", page),
+    )
+
+    async def fetch() -> Any:
+        result = await client.search(params)
+        if client.community_url:
+            result = _resolve_urls(result, client.community_url)
+        return result
+
+    return await _cached_result(
+        ("search_community", frozenset(params.items())),
+        fetch,
+        ttl=_SEARCH_CACHE_TTL,
     )
-    result = await client.search(params)
-    if client.community_url:
-        result = _resolve_urls(result, client.community_url)
-    return json.dumps(result, indent=2)
 
 
-@mcp.tool()
+@mcp.tool(structured_output=False)
 async def search_tags(
     query: str | None = None,
     page: int | None = None,
@@ -110,17 +265,16 @@ async def search_tags(
         page: Page number for pagination (starts at 1).
     """
     client = _get_client()
-    params = _clean(
-        {
-            "q": query,
-            "page": page,
-        }
+    params = _params(("q", query), ("page", page))
+    return await _cached_result(
+        ("search_tags", frozenset(params.items())),
+        client.search_tags,
+        params,
+        ttl=_SEARCH_CACHE_TTL,
     )
-    result = await client.search_tags(params)
-    return json.dumps(result, indent=2)
 
 
-@mcp.tool()
+@mcp.tool(structured_output=False)
 async def list_topics(
     content_type: str | None = None,
     category_ids: str | None = None,
@@ -134,6 +288,7 @@ async def list_topics(
     active_before: str | None = None,
     page: int | None = None,
     page_size: int | None = None,
+    prefetch_pages: int | None = None,
 ) -> str:
     """List community topics with optional filtering and sorting.
 
@@ -154,86 +309,205 @@ async def list_topics(
         active_before: ISO date string — only topics with activity on or before this date.
         page: Page number (starts at 1).
         page_size: Results per page.
+        prefetch_pages: Fetch this many consecutive pages, starting at page, concurrently and merge their results (max 10).
     """
     client = _get_client()
 
     # Use type-specific endpoints when content_type is set
     if content_type:
-        params = _clean({"page": page, "pageSize": page_size})
-        if content_type == "question":
-            result = await client.list_questions(params)
-        elif content_type == "conversation":
-            result = await client.list_conversations(params)
-        elif content_type == "article":
-            result = await client.list_articles(params)
-        elif content_type == "idea":
-            result = await client.list_ideas(params)
-        elif content_type == "productUpdate":
-            result = await client.list_product_updates(params)
-        else:
-            result = await client.list_topics(params)
-        return json.dumps(result, indent=2)
+        fetch = getattr(client, _LIST_METHODS.get(content_type, "list_topics"))
+        params = _params(("page", page), ("pageSize", page_size))
+    else:
+        # Build unified /v2/topics params with full filtering support
+        fetch = client.list_topics
+        params = _params(
+            ("categoryIds", category_ids),
+            ("tags", tags),
+            ("moderatorTags", moderator_tags),
+            ("contentTypes", content_types),
+            ("sort", sort),
+            ("createdAt", _date_range(created_after, created_before)),
+            ("lastActivity", _date_range(active_after, active_before)),
+            ("page", page),
+            ("pageSize", page_size),
+        )
+
+    if prefetch_pages:
+        result = await _fetch_pages(fetch, params, prefetch_pages)
+    else:
+        result = await fetch(params)
+    return _dumps(result)
+
+
+@mcp.tool(structured_output=False)
+async def list_topics_all(
+    category_ids: str | None = None,
+    tags: str | None = None,
+    moderator_tags: str | None = None,
+    content_types: str | None = None,
+    sort: str | None = None,
+    created_after: str | None = None,
+    created_before: str | None = None,
+    active_after: str | None = None,
+    active_before: str | None = None,
+    page_size: int | None = None,
+    max_pages: int = _MAX_PAGES,
+) -> str:
+    """List topics across multiple pages in a single call.
 
-    # Build unified /v2/topics params with full filtering support
-    created_at = None
-    if created_after or created_before:
-        created_at = _clean({"from": created_after, "to": created_before})
+    Accepts the same filters as list_topics, then fetches pages concurrently
+    and returns their results concatenated. Use this instead of calling
+    list_topics repeatedly with increasing page numbers.
 
-    last_activity = None
-    if active_after or active_before:
-        last_activity = _clean({"from": active_after, "to": active_before})
+    Args:
+        category_ids: Comma-separated category IDs to filter by.
+        tags: Comma-separated public tags to filter by.
+        moderator_tags: Comma-separated moderator tags to filter by.
+        content_types: Comma-separated content types to filter by (e.g. "question,idea").
+        sort: Sort field — e.g. "createdAt", "lastActivity" (descending order).
+        created_after: ISO date string — only topics created on or after this date.
+        created_before: ISO date string — only topics created on or before this date.
+        active_after: ISO date string — only topics with activity on or after this date.
+        active_before: ISO date string — only topics with activity on or before this date.
+        page_size: Results per page.
+        max_pages: Maximum number of pages to fetch (1-10, default 10).
+    """
+    client = _get_client()
 
-    params = _clean(
-        {
-            "categoryIds": category_ids,
-            "tags": tags,
-            "moderatorTags": moderator_tags,
-            "contentTypes": content_types,
-            "sort": sort,
-            "createdAt": json.dumps(created_at) if created_at else None,
-            "lastActivity": json.dumps(last_activity) if last_activity else None,
-            "page": page,
-            "pageSize": page_size,
-        }
+    params = _params(
+        ("categoryIds", category_ids),
+        ("tags", tags),
+        ("moderatorTags", moderator_tags),
+        ("contentTypes", content_types),
+        ("sort", sort),
+        ("createdAt", _date_range(created_after, created_before)),
+        ("lastActivity", _date_range(active_after, active_before)),
+        ("pageSize", page_size),
+    )
+    max_pages = max(1, min(max_pages, _MAX_PAGES))
+    result = await client.list_all_topics(params, max_pages=max_pages)
+    return _dumps(result)
+
+
+async def _fetch_topic(
+    client: GainsightClient, topic_id: int, content_type: str | None = None
+) -> Any:
+    """Fetch a topic's detail with its replies attached, or ``None`` if not found."""
+    if content_type is None:
+        content_type = _topic_types.get(topic_id)
+        if content_type is not None:
+            _topic_types.move_to_end(topic_id)
+            try:
+                return await _fetch_topic_detail(client, topic_id, content_type)
+            except httpx.HTTPStatusError as exc:
+                if exc.response.status_code != 404:
+                    raise
+            # The remembered type is stale (topic deleted or moved), so
+            # forget it and look the topic up again
+            _topic_types.pop(topic_id, None)
+            content_type = None
+
+    if content_type is None:
+        # Look up the topic to find its content type
+        lookup = await client.get_topic_by_id(topic_id)
+        results = lookup.get("result", [])
+        if not results:
+            return None
+        content_type = results[0]["contentType"]
+
+    return await _fetch_topic_detail(client, topic_id, content_type)
+
+
+async def _fetch_topic_detail(
+    client: GainsightClient, topic_id: int, content_type: str
+) -> Any:
+    """Fetch detail and replies for a topic whose content type is known."""
+    # Detail and replies are independent, so fetch them in parallel
+    topic, replies = await asyncio.gather(
+        client.get_topic_detail(content_type, topic_id),
+        client.try_get_topic_replies(content_type, topic_id),
     )
-    result = await client.list_topics(params)
-    return json.dumps(result, indent=2)
+    topic["replies"] = replies
+    _remember_topic_type(topic_id, content_type)
+
+    if client.community_url:
+        topic = _resolve_urls(topic, client.community_url)
+    return topic
 
 
-@mcp.tool()
-async def get_topic(topic_id: int) -> str:
+@mcp.tool(structured_output=False)
+async def get_topic(topic_id: int, content_type: str | None = None) -> str:
     """Retrieve full details for a specific topic, including body content and replies.
 
-    Looks up the topic by ID to determine its content type, then fetches the
-    full detail and replies from the type-specific endpoint.
+    Looks up the topic by ID to determine its content type (unless one is
+    given or already known from an earlier call), then fetches the full
+    detail and replies concurrently from the type-specific endpoint.
 
     Args:
         topic_id: The numeric ID of the topic to retrieve.
+        content_type: Optional content type (article, conversation, question, idea,
+            productUpdate). When known, skips the lookup round-trip.
     """
-    client = _get_client()
+    if content_type is not None and content_type not in _VALID_CONTENT_TYPES:
+        return _content_type_error(content_type)
+    topic = await _fetch_topic(_get_client(), topic_id, content_type)
+    if topic is None:
+        return _err(f"Topic {topic_id} not found")
+    return _dumps(topic)
 
-    # Look up the topic to find its content type
-    lookup = await client.get_topic_by_id(topic_id)
-    results = lookup.get("result", [])
-    if not results:
-        return json.dumps({"error": f"Topic {topic_id} not found"})
 
-    content_type = results[0]["contentType"]
+# Topics fetched at once by get_topics_bulk; each topic issues up to three
+# requests, so this keeps a large batch well inside the connection pool.
+_BULK_CONCURRENCY = 20
+# Cap on IDs per get_topics_bulk call, which bounds one call to 3x this many
+# requests regardless of concurrency
+_BULK_MAX_TOPICS = 50
 
-    # Fetch full detail and replies using the type-specific endpoints
-    topic = await client.get_topic_detail(content_type, topic_id)
-    try:
-        replies = await client.get_topic_replies(content_type, topic_id)
-    except httpx.HTTPStatusError:
-        replies = {"result": [], "_metadata": {"totalCount": 0}}
-    topic["replies"] = replies
 
-    if client.community_url:
-        topic = _resolve_urls(topic, client.community_url)
-    return json.dumps(topic, indent=2)
+@mcp.tool(structured_output=False)
+async def get_topics_bulk(topic_ids: list[int]) -> str:
+    """Retrieve full details and replies for several topics in one call.
+
+    Fetches all topics concurrently, so it is much faster than calling
+    get_topic once per ID — e.g. to expand a page of search results.
+    Topics that don't exist or fail to load come back as an error entry in
+    their place, so one bad ID does not lose the rest of the batch.
 
+    Args:
+        topic_ids: The numeric IDs of the topics to retrieve (at most 50).
+    """
+    if len(topic_ids) > _BULK_MAX_TOPICS:
+        return _err(
+            f"Too many topic IDs ({len(topic_ids)}); "
+            f"request at most {_BULK_MAX_TOPICS} per call"
+        )
+    client = _get_client()
+    semaphore = asyncio.Semaphore(_BULK_CONCURRENCY)
+
+    async def fetch(topic_id: int) -> Any:
+        try:
+            async with semaphore:
+                topic = await _fetch_topic(client, topic_id)
+        except httpx.HTTPStatusError as exc:
+            reason = f"HTTP {exc.response.status_code}"
+        except httpx.HTTPError as exc:
+            # Timeouts and connection errors
+            reason = type(exc).__name__
+        except ValueError as exc:
+            # The lookup returned a content type the client doesn't know
+            reason = str(exc)
+        else:
+            if topic is None:
+                return {"id": topic_id, "error": f"Topic {topic_id} not found"}
+            return topic
+        return {"id": topic_id, "error": f"Failed to fetch topic {topic_id}: {reason}"}
 
-@mcp.tool()
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(fetch(topic_id)) for topic_id in topic_ids]
+    return _dumps({"result": [task.result() for task in tasks]})
+
+
+@mcp.tool(structured_output=False)
 async def list_ideas(
     page: int | None = None,
     page_size: int | None = None,
@@ -245,12 +519,12 @@ async def list_ideas(
         page_size: Results per page.
     """
     client = _get_client()
-    params = _clean({"page": page, "pageSize": page_size})
+    params = _params(("page", page), ("pageSize", page_size))
     result = await client.list_ideas(params)
-    return json.dumps(result, indent=2)
+    return _dumps(result)
 
 
-@mcp.tool()
+@mcp.tool(structured_output=False)
 async def list_categories() -> str:
     """List all community categories with their IDs.
 
@@ -258,14 +532,15 @@ async def list_categories() -> str:
     for use with list_topics_by_category.
     """
     client = _get_client()
-    result = await client.list_categories()
-    return json.dumps(result, indent=2)
+    return await _cached_result(
+        ("list_categories",), functools.partial(client.list_categories, cache=False)
+    )
 
 
 # ---------- New tools ----------
 
 
-@mcp.tool()
+@mcp.tool(structured_output=False)
 async def list_tags(
     page: int | None = None,
     page_size: int | None = None,
@@ -279,12 +554,15 @@ async def list_tags(
         page_size: Results per page.
     """
     client = _get_client()
-    params = _clean({"page": page, "pageSize": page_size})
-    result = await client.list_tags(params)
-    return json.dumps(result, indent=2)
+    params = _params(("page", page), ("pageSize", page_size))
+    return await _cached_result(
+        ("list_tags", frozenset(params.items())),
+        functools.partial(client.list_tags, cache=False),
+        params,
+    )
 
 
-@mcp.tool()
+@mcp.tool(structured_output=False)
 async def get_category(category_id: int) -> str:
     """Get details for a single category by its ID.
 
@@ -292,11 +570,14 @@ async def get_category(category_id: int) -> str:
         category_id: The numeric ID of the category.
     """
     client = _get_client()
-    result = await client.get_category(category_id)
-    return json.dumps(result, indent=2)
+    return await _cached_result(
+        ("get_category", category_id),
+        functools.partial(client.get_category, cache=False),
+        category_id,
+    )
 
 
-@mcp.tool()
+@mcp.tool(structured_output=False)
 async def get_category_tree() -> str:
     """Get the full category hierarchy as a tree structure.
 
@@ -304,11 +585,12 @@ async def get_category_tree() -> str:
     Useful for understanding the community's organisational structure.
     """
     client = _get_client()
-    result = await client.get_category_tree()
-    return json.dumps(result, indent=2)
+    return await _cached_result(
+        ("get_category_tree",), functools.partial(client.get_category_tree, cache=False)
+    )
 
 
-@mcp.tool()
+@mcp.tool(structured_output=False)
 async def get_category_topic_counts() -> str:
     """Get the number of visible topics in each category.
 
@@ -316,10 +598,32 @@ async def get_category_topic_counts() -> str:
     """
     client = _get_client()
     result = await client.get_category_topic_counts()
-    return json.dumps(result, indent=2)
+    return _dumps(result)
+
+
+@mcp.tool(structured_output=False)
+async def community_overview() -> str:
+    """Get categories, the category tree, and per-category topic counts in one call.
+
+    Fetches all three concurrently. A good first step for understanding
+    the community's structure and where the activity is.
+    """
+    client = _get_client()
+    categories, tree, topic_counts = await asyncio.gather(
+        client.list_categories(),
+        client.get_category_tree(),
+        client.get_category_topic_counts(),
+    )
+    return _dumps(
+        {
+            "categories": categories,
+            "category_tree": tree,
+            "topic_counts": topic_counts,
+        }
+    )
 
 
-@mcp.tool()
+@mcp.tool(structured_output=False)
 async def list_topics_by_category(
     category_id: int,
     tags: str | None = None,
@@ -331,6 +635,7 @@ async def list_topics_by_category(
     active_before: str | None = None,
     page: int | None = None,
     page_size: int | None = None,
+    prefetch_pages: int | None = None,
 ) -> str:
     """List topics within a specific category.
 
@@ -347,33 +652,31 @@ async def list_topics_by_category(
         active_before: ISO date string — only topics with activity on or before this date.
         page: Page number (starts at 1).
         page_size: Results per page.
+        prefetch_pages: Fetch this many consecutive pages, starting at page, concurrently and merge their results (max 10).
     """
     client = _get_client()
 
-    created_at = None
-    if created_after or created_before:
-        created_at = _clean({"from": created_after, "to": created_before})
-
-    last_activity = None
-    if active_after or active_before:
-        last_activity = _clean({"from": active_after, "to": active_before})
-
-    params = _clean(
-        {
-            "tags": tags,
-            "moderatorTags": moderator_tags,
-            "sort": sort,
-            "createdAt": json.dumps(created_at) if created_at else None,
-            "lastActivity": json.dumps(last_activity) if last_activity else None,
-            "page": page,
-            "pageSize": page_size,
-        }
+    params = _params(
+        ("tags", tags),
+        ("moderatorTags", moderator_tags),
+        ("sort", sort),
+        ("createdAt", _date_range(created_after, created_before)),
+        ("lastActivity", _date_range(active_after, active_before)),
+        ("page", page),
+        ("pageSize", page_size),
     )
-    result = await client.list_topics_by_category(category_id, params)
-    return json.dumps(result, indent=2)
-
-
-@mcp.tool()
+    if prefetch_pages:
+        result = await _fetch_pages(
+            functools.partial(client.list_topics_by_category, category_id),
+            params,
+            prefetch_pages,
+        )
+    else:
+        result = await client.list_topics_by_category(category_id, params)
+    return _dumps(result)
+
+
+@mcp.tool(structured_output=False)
 async def list_idea_statuses() -> str:
     """List all idea statuses (e.g. "New", "Planned", "Shipped").
 
@@ -381,22 +684,26 @@ async def list_idea_statuses() -> str:
     in the community.
     """
     client = _get_client()
-    result = await client.list_idea_statuses()
-    return json.dumps(result, indent=2)
+    return await _cached_result(
+        ("list_idea_statuses",),
+        functools.partial(client.list_idea_statuses, cache=False),
+    )
 
 
-@mcp.tool()
+@mcp.tool(structured_output=False)
 async def list_product_areas() -> str:
     """List all product areas defined in the community.
 
     Product areas are used to categorise ideas and product updates.
     """
     client = _get_client()
-    result = await client.list_product_areas()
-    return json.dumps(result, indent=2)
+    return await _cached_result(
+        ("list_product_areas",),
+        functools.partial(client.list_product_areas, cache=False),
+    )
 
 
-@mcp.tool()
+@mcp.tool(structured_output=False)
 async def get_poll_results(topic_id: int, content_type: str) -> str:
     """Get poll results for a topic that has a poll attached.
 
@@ -404,12 +711,14 @@ async def get_poll_results(topic_id: int, content_type: str) -> str:
         topic_id: The numeric ID of the topic.
         content_type: The content type: article, conversation, question, idea, or productUpdate.
     """
+    if content_type not in _VALID_CONTENT_TYPES:
+        return _content_type_error(content_type)
     client = _get_client()
     result = await client.get_poll_results(content_type, topic_id)
-    return json.dumps(result, indent=2)
+    return _dumps(result)
 
 
-@mcp.tool()
+@mcp.tool(structured_output=False)
 async def get_reply(
     topic_id: int,
     reply_id: int,
@@ -422,12 +731,17 @@ async def get_reply(
         reply_id: The numeric ID of the reply.
         content_type: The content type: article, conversation, question, idea, or productUpdate.
     """
+    if content_type not in _VALID_CONTENT_TYPES:
+        return _content_type_error(content_type)
     client = _get_client()
     result = await client.get_reply(content_type, topic_id, reply_id)
-    return json.dumps(result, indent=2)
+    return _dumps(result)
+
 
+_community_info: tuple[GainsightClient, str] | None = None
 
-@mcp.tool()
+
+@mcp.tool(structured_output=False)
 async def get_community_info() -> str:
     """Get basic information about the connected community.
 
@@ -435,14 +749,19 @@ async def get_community_info() -> str:
     Useful for constructing links to community content or confirming which
     community the server is connected to.
     """
+    global _community_info
     client = _get_client()
-    info: dict[str, Any] = {
-        "region": client.region,
-        "api_base_url": client.base_url,
-    }
-    if client.community_url:
-        info["community_url"] = client.community_url
-    return json.dumps(info, indent=2)
+    # The answer depends only on the client's fixed settings, so build the
+    # JSON once per client instance
+    if _community_info is None or _community_info[0] is not client:
+        info: dict[str, Any] = {
+            "region": client.region,
+            "api_base_url": client.base_url,
+        }
+        if client.community_url:
+            info["community_url"] = client.community_url
+        _community_info = (client, _dumps(info))
+    return _community_info[1]
 
 
 def main() -> None:
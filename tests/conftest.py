@@ -0,0 +1,22 @@
+"""Shared pytest configuration."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from typing import Any
+
+import pytest
+
+try:
+    import uvloop
+except ImportError:  # not available on Windows
+    uvloop = None
+
+
+def pytest_asyncio_loop_factories(
+    config: pytest.Config, item: pytest.Item
+) -> Mapping[str, Callable[[], Any]] | None:
+    """Run async tests on uvloop when it is installed."""
+    if uvloop is None:
+        return None
+    return {"uvloop": uvloop.new_event_loop}
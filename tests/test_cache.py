@@ -0,0 +1,40 @@
+"""Tests for the in-memory TTL cache."""
+
+from __future__ import annotations
+
+from src.cache import TTLCache
+
+
+def test_get_returns_stored_value() -> None:
+    cache = TTLCache(ttl=60, maxsize=8)
+    cache.set("key", {"result": []})
+    assert cache.get("key") == {"result": []}
+
+
+def test_get_missing_key_returns_none() -> None:
+    cache = TTLCache(ttl=60, maxsize=8)
+    assert cache.get("missing") is None
+
+
+def test_expired_entry_is_dropped() -> None:
+    cache = TTLCache(ttl=60, maxsize=8)
+    cache.set("key", "value", ttl=0)
+    assert cache.get("key") is None
+    assert len(cache) == 0
+
+
+def test_oldest_entry_evicted_when_full() -> None:
+    cache = TTLCache(ttl=60, maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert cache.get("c") == 3
+
+
+def test_clear() -> None:
+    cache = TTLCache(ttl=60, maxsize=8)
+    cache.set("key", "value")
+    cache.clear()
+    assert len(cache) == 0
@@ -2,103 +2,249 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
+from collections.abc import AsyncIterator, Iterator
+
 import httpx
 import pytest
 import respx
 
-from src.client import GainsightClient, REGION_BASE_URLS
+from src import client as client_module
+from src.client import GainsightClient, REGION_BASE_URLS, aclose_http_clients
 
 EU_BASE = REGION_BASE_URLS["eu-west-1"]
 US_BASE = REGION_BASE_URLS["us-west-2"]
 
-
-@pytest.fixture(autouse=True)
-def _env(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setenv("GS_CC_CLIENT_ID", "test-id")
-    monkeypatch.setenv("GS_CC_CLIENT_SECRET", "test-secret")
-    monkeypatch.setenv("GS_CC_REGION", "eu-west-1")
+# Routes every test starts with; tests override only the endpoints they
+# exercise, and the overrides are rolled back afterwards.
+_DEFAULT_ROUTES: dict[tuple[str, str], dict[str, object]] = {
+    ("POST", "/oauth2/token"): {"access_token": "tok-123", "expires_in": 3600},
+    ("GET", "/v2/categories"): {"result": []},
+    ("GET", "/v2/topics"): {"result": []},
+}
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _env() -> Iterator[None]:
+    """Set credentials once per module; tests may still override them."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("GS_CC_CLIENT_ID", "test-id")
+        mp.setenv("GS_CC_CLIENT_SECRET", "test-secret")
+        mp.setenv("GS_CC_REGION", "eu-west-1")
+        yield
+
+
+@pytest.fixture(scope="session")
+def _shared_client() -> GainsightClient:
+    return GainsightClient(
+        client_id="test-id", client_secret="test-secret", region="eu-west-1"
+    )
 
 
 @pytest.fixture
-def client() -> GainsightClient:
-    return GainsightClient()
+async def client(_shared_client: GainsightClient) -> AsyncIterator[GainsightClient]:
+    """One client for the whole session, returned to a fresh state after each test."""
+    yield _shared_client
+    await _shared_client.close()
+    _shared_client._access_token = None
+    _shared_client._auth_headers = {}
+    _shared_client._token_expires_at = 0.0
+    _shared_client.clear_cache()
+    # aclose_http_clients() tests close the shared pool out from under it
+    _shared_client._http = client_module._get_http_client(_shared_client.base_url)
+
+
+@pytest.fixture(scope="module")
+def _router() -> Iterator[respx.MockRouter]:
+    """A single EU router for the module, built and started once."""
+    router = respx.mock(base_url=EU_BASE, assert_all_called=False)
+    for (method, path), body in _DEFAULT_ROUTES.items():
+        router.request(method, path, name=f"{method} {path}").respond(json=body)
+    with router:
+        yield router
 
 
-def _mock_token(router: respx.MockRouter) -> None:
-    router.post("/oauth2/token").mock(
-        return_value=httpx.Response(
-            200,
-            json={"access_token": "tok-123", "expires_in": 3600},
-        )
-    )
+@pytest.fixture(autouse=True)
+def respx_mock(_router: respx.MockRouter) -> Iterator[respx.MockRouter]:
+    """The module router, restored to its default routes after each test."""
+    _router.snapshot()
+    yield _router
+    _router.rollback()
+
+
+@pytest.fixture
+def token_route(respx_mock: respx.MockRouter) -> respx.Route:
+    """The default token route, for tests that count or inspect token requests."""
+    return respx_mock.routes["POST /oauth2/token"]
 
 
 # ---- Token tests ----
 
 
-@respx.mock(base_url=EU_BASE)
-async def test_token_includes_scope(respx_mock: respx.MockRouter, client: GainsightClient) -> None:
+async def test_token_includes_scope(token_route: respx.Route, client: GainsightClient) -> None:
     """Token request must include scope=read."""
-    token_route = respx_mock.post("/oauth2/token").mock(
-        return_value=httpx.Response(
-            200, json={"access_token": "tok-scoped", "expires_in": 3600}
-        )
-    )
-    respx_mock.get("/v2/categories").mock(
-        return_value=httpx.Response(200, json={"result": []})
-    )
-
     await client.list_categories()
 
     request = token_route.calls[0].request
     body = request.content.decode()
     assert "scope=read" in body
-    await client.close()
 
 
-@respx.mock(base_url=EU_BASE)
-async def test_token_caching(respx_mock: respx.MockRouter, client: GainsightClient) -> None:
+async def test_token_caching(token_route: respx.Route, client: GainsightClient) -> None:
     """Token should be reused within its expiry window."""
+    await client.list_categories()
+    await client.list_categories()
+
+    assert token_route.call_count == 1
+
+
+async def test_token_refreshed_in_background(
+    respx_mock: respx.MockRouter,
+    client: GainsightClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The refresh task should replace the token before it expires."""
+    monkeypatch.setattr(client_module, "TOKEN_REFRESH_MIN_INTERVAL", 0.01)
     token_route = respx_mock.post("/oauth2/token").mock(
-        return_value=httpx.Response(
-            200, json={"access_token": "tok-cached", "expires_in": 3600}
-        )
+        side_effect=[
+            # Lives for less than the floor, so refresh is due almost immediately
+            httpx.Response(200, json={"access_token": "tok-old", "expires_in": 0.01}),
+            httpx.Response(200, json={"access_token": "tok-new", "expires_in": 3600}),
+        ]
     )
-    respx_mock.get("/v2/categories").mock(
-        return_value=httpx.Response(200, json={"result": []})
+
+    await client.list_topics({})
+    await asyncio.sleep(0.05)
+
+    assert token_route.call_count == 2
+    assert client._access_token == "tok-new"
+    await client.close()
+    assert client._refresh_task is None
+
+
+async def test_short_lived_token_refreshed_at_half_lifetime(
+    respx_mock: respx.MockRouter,
+    client: GainsightClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A token inside the 60 s buffer must not make the idle loop spin."""
+    monkeypatch.setattr(client_module, "TOKEN_REFRESH_MIN_INTERVAL", 0.01)
+    token_route = respx_mock.post("/oauth2/token").respond(
+        json={"access_token": "tok", "expires_in": 60}
     )
 
-    await client.list_categories()
-    await client.list_categories()
+    await client.list_topics({})
+    await asyncio.sleep(0.1)
+
+    assert token_route.call_count == 1
+    assert client._token_expires_at - time.monotonic() > 29
+
+
+@pytest.mark.parametrize(
+    "failed_refresh",
+    [
+        httpx.Response(503),
+        httpx.Response(200, json={"token_type": "bearer"}),
+        httpx.Response(200, text="<html>maintenance</html>"),
+    ],
+    ids=["error_status", "missing_token", "invalid_json"],
+)
+async def test_failed_background_refresh_falls_back_to_next_request(
+    respx_mock: respx.MockRouter,
+    client: GainsightClient,
+    monkeypatch: pytest.MonkeyPatch,
+    failed_refresh: httpx.Response,
+) -> None:
+    monkeypatch.setattr(client_module, "TOKEN_REFRESH_MIN_INTERVAL", 0.01)
+    token_route = respx_mock.post("/oauth2/token").mock(
+        side_effect=[
+            httpx.Response(200, json={"access_token": "tok-old", "expires_in": 0.01}),
+            failed_refresh,
+            httpx.Response(200, json={"access_token": "tok-new", "expires_in": 3600}),
+        ]
+    )
+
+    await client.list_topics({})
+    refresh_task = client._refresh_task
+    await asyncio.sleep(0.05)
+    assert refresh_task.done() and refresh_task.exception() is None
+    assert client._access_token is None
+    assert client._auth_headers == {}
+
+    await client.list_topics({})
+    assert token_route.call_count == 3
+    assert client._access_token == "tok-new"
+
+
+async def test_unauthorized_response_refreshes_token_and_retries(
+    respx_mock: respx.MockRouter, client: GainsightClient
+) -> None:
+    token_route = respx_mock.post("/oauth2/token").mock(
+        side_effect=[
+            httpx.Response(200, json={"access_token": "tok-revoked", "expires_in": 3600}),
+            httpx.Response(200, json={"access_token": "tok-fresh", "expires_in": 3600}),
+        ]
+    )
+    route = respx_mock.get("/v2/topics").mock(
+        side_effect=[
+            httpx.Response(401),
+            httpx.Response(200, json={"result": [{"id": "1"}]}),
+        ]
+    )
+
+    result = await client.list_topics({})
+
+    assert result["result"][0]["id"] == "1"
+    assert token_route.call_count == 2
+    assert route.calls[1].request.headers["Authorization"] == "Bearer tok-fresh"
+
+
+async def test_unauthorized_retry_happens_once(
+    respx_mock: respx.MockRouter, client: GainsightClient
+) -> None:
+    route = respx_mock.get("/v2/topics").respond(401)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.list_topics({})
+
+    assert route.call_count == 2
+
+
+async def test_requests_send_bearer_token(
+    respx_mock: respx.MockRouter, client: GainsightClient
+) -> None:
+    route = respx_mock.get("/v2/topics").respond(json={"result": []})
+
+    await client.list_topics({})
+
+    headers = route.calls[0].request.headers
+    assert headers["Authorization"] == "Bearer tok-123"
+    assert headers["Accept"] == "*/*"
+
+
+async def test_concurrent_requests_share_one_token(
+    token_route: respx.Route, client: GainsightClient
+) -> None:
+    """Concurrent cold-start requests should trigger a single token fetch."""
+    await asyncio.gather(*(client.list_categories() for _ in range(5)))
 
     assert token_route.call_count == 1
-    await client.close()
 
 
 # ---- Search ----
 
 
-@respx.mock(base_url=EU_BASE)
 async def test_search(respx_mock: respx.MockRouter, client: GainsightClient) -> None:
-    _mock_token(respx_mock)
-    respx_mock.get("/search").mock(
-        return_value=httpx.Response(
-            200, json={"community": [{"id": "1", "title": "SSO"}]}
-        )
-    )
+    respx_mock.get("/search").respond(json={"community": [{"id": "1", "title": "SSO"}]})
 
     result = await client.search({"q": "SSO"})
     assert result["community"][0]["title"] == "SSO"
-    await client.close()
 
 
-@respx.mock(base_url=EU_BASE)
 async def test_search_with_filters(respx_mock: respx.MockRouter, client: GainsightClient) -> None:
-    _mock_token(respx_mock)
-    route = respx_mock.get("/search").mock(
-        return_value=httpx.Response(
-            200, json={"community": [{"id": "2", "contentType": "question"}]}
-        )
+    route = respx_mock.get("/search").respond(
+        json={"community": [{"id": "2", "contentType": "question"}]}
     )
 
     result = await client.search({
@@ -113,296 +259,257 @@ async def test_search_with_filters(respx_mock: respx.MockRouter, client: Gainsig
     request = route.calls[0].request
     assert "categoryIds" in str(request.url)
     assert "contentTypes" in str(request.url)
-    await client.close()
 
 
-@respx.mock(base_url=EU_BASE)
 async def test_search_tags(respx_mock: respx.MockRouter, client: GainsightClient) -> None:
-    _mock_token(respx_mock)
-    respx_mock.get("/search/tags").mock(
-        return_value=httpx.Response(
-            200, json={"tags": [{"id": "1", "name": "api", "count": 42}]}
-        )
+    respx_mock.get("/search/tags").respond(
+        json={"tags": [{"id": "1", "name": "api", "count": 42}]}
     )
 
     result = await client.search_tags({"q": "api"})
     assert result["tags"][0]["name"] == "api"
     assert result["tags"][0]["count"] == 42
-    await client.close()
 
 
-# ---- List endpoints ----
+# ---- Response decoding ----
 
 
-@respx.mock(base_url=EU_BASE)
-async def test_list_topics(respx_mock: respx.MockRouter, client: GainsightClient) -> None:
-    _mock_token(respx_mock)
-    respx_mock.get("/v2/topics").mock(
-        return_value=httpx.Response(200, json={"result": []})
-    )
+@pytest.mark.parametrize("use_orjson", [True, False])
+async def test_response_decoding(
+    respx_mock: respx.MockRouter,
+    client: GainsightClient,
+    monkeypatch: pytest.MonkeyPatch,
+    use_orjson: bool,
+) -> None:
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(client_module, "orjson", None)
+    respx_mock.get("/v2/topics").respond(json={"result": [{"title": "café"}]})
 
     result = await client.list_topics({})
-    assert result == {"result": []}
-    await client.close()
+    assert result == {"result": [{"title": "café"}]}
 
 
-@respx.mock(base_url=EU_BASE)
-async def test_list_questions(respx_mock: respx.MockRouter, client: GainsightClient) -> None:
-    _mock_token(respx_mock)
-    respx_mock.get("/v2/questions").mock(
-        return_value=httpx.Response(200, json={"result": [{"contentType": "question"}]})
-    )
+# ---- List endpoints ----
 
-    result = await client.list_questions({})
-    assert result["result"][0]["contentType"] == "question"
-    await client.close()
 
+_LIST_CASES = [
+    ("list_topics", ({},), "/v2/topics", {"result": [{"id": "5"}]}),
+    ("list_questions", ({},), "/v2/questions", {"result": [{"contentType": "question"}]}),
+    ("list_ideas", ({},), "/v2/ideas", {"result": [{"contentType": "idea"}]}),
+    ("list_categories", (), "/v2/categories", {"result": [{"id": "1", "name": "General"}]}),
+    ("list_tags", (), "/v2/tags", {"result": [{"id": "1", "name": "api"}]}),
+    ("list_moderator_tags", (), "/v2/moderatorTags", {"result": [{"name": "internal"}]}),
+    ("list_idea_statuses", (), "/v2/ideas/ideaStatuses", {"result": [{"name": "Planned"}]}),
+    ("list_product_areas", (), "/v2/productAreas", {"result": [{"name": "Platform"}]}),
+]
+
+
+@pytest.mark.parametrize(("method", "args", "path", "payload"), _LIST_CASES)
+async def test_list_endpoints(
+    respx_mock: respx.MockRouter,
+    client: GainsightClient,
+    method: str,
+    args: tuple[object, ...],
+    path: str,
+    payload: dict[str, object],
+) -> None:
+    route = respx_mock.get(path).respond(json=payload)
 
-@respx.mock(base_url=EU_BASE)
-async def test_list_ideas(respx_mock: respx.MockRouter, client: GainsightClient) -> None:
-    _mock_token(respx_mock)
-    respx_mock.get("/v2/ideas").mock(
-        return_value=httpx.Response(200, json={"result": [{"contentType": "idea"}]})
-    )
+    assert await getattr(client, method)(*args) == payload
+    assert route.call_count == 1
 
-    result = await client.list_ideas({})
-    assert result["result"][0]["contentType"] == "idea"
-    await client.close()
+
+# ---- Pagination ----
 
 
-@respx.mock(base_url=EU_BASE)
-async def test_list_categories(respx_mock: respx.MockRouter, client: GainsightClient) -> None:
-    _mock_token(respx_mock)
-    respx_mock.get("/v2/categories").mock(
-        return_value=httpx.Response(
-            200, json={"result": [{"id": "1", "name": "General"}]}
+def _paged_topics(total: int, page_size: int) -> object:
+    """Return a respx side effect serving ``total`` topics in pages."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        start = (page - 1) * page_size
+        ids = range(start, min(start + page_size, total))
+        return httpx.Response(
+            200,
+            json={
+                "result": [{"id": str(i)} for i in ids],
+                "_metadata": {"totalCount": total, "limit": page_size},
+            },
         )
-    )
 
-    result = await client.list_categories()
-    assert result["result"][0]["name"] == "General"
-    await client.close()
+    return handler
 
 
-@respx.mock(base_url=EU_BASE)
-async def test_list_tags(respx_mock: respx.MockRouter, client: GainsightClient) -> None:
-    _mock_token(respx_mock)
-    respx_mock.get("/v2/tags").mock(
-        return_value=httpx.Response(
-            200, json={"result": [{"id": "1", "name": "api"}]}
-        )
-    )
+async def test_list_all_topics_fetches_every_page(
+    respx_mock: respx.MockRouter, client: GainsightClient
+) -> None:
+    route = respx_mock.get("/v2/topics").mock(side_effect=_paged_topics(60, 25))
 
-    result = await client.list_tags()
-    assert result["result"][0]["name"] == "api"
-    await client.close()
+    result = await client.list_all_topics({"pageSize": 25, "tags": "api"})
 
+    assert [t["id"] for t in result["result"]] == [str(i) for i in range(60)]
+    assert result["_metadata"]["totalCount"] == 60
+    assert route.call_count == 3
+    assert all(call.request.url.params["tags"] == "api" for call in route.calls)
 
-@respx.mock(base_url=EU_BASE)
-async def test_list_moderator_tags(respx_mock: respx.MockRouter, client: GainsightClient) -> None:
-    _mock_token(respx_mock)
-    respx_mock.get("/v2/moderatorTags").mock(
-        return_value=httpx.Response(
-            200, json={"result": [{"id": "1", "name": "internal"}]}
-        )
-    )
 
-    result = await client.list_moderator_tags()
-    assert result["result"][0]["name"] == "internal"
-    await client.close()
+async def test_list_all_topics_respects_max_pages(
+    respx_mock: respx.MockRouter, client: GainsightClient
+) -> None:
+    route = respx_mock.get("/v2/topics").mock(side_effect=_paged_topics(500, 25))
+
+    result = await client.list_all_topics({}, max_pages=2)
+
+    assert len(result["result"]) == 50
+    assert route.call_count == 2
+
+
+async def test_paginate_without_metadata_returns_first_page(
+    respx_mock: respx.MockRouter, client: GainsightClient
+) -> None:
+    route = respx_mock.get("/v2/topics").respond(json={"result": [{"id": "1"}]})
+
+    result = await client.list_all_topics({})
+
+    assert result == {"result": [{"id": "1"}]}
+    assert route.call_count == 1
 
 
 # ---- Category endpoints ----
 
 
-@respx.mock(base_url=EU_BASE)
 async def test_get_category(respx_mock: respx.MockRouter, client: GainsightClient) -> None:
-    _mock_token(respx_mock)
-    respx_mock.get("/v2/categories/5").mock(
-        return_value=httpx.Response(
-            200, json={"id": "5", "name": "Feature Requests"}
-        )
+    respx_mock.get("/v2/categories/5").respond(
+        json={"id": "5", "name": "Feature Requests"}
     )
 
     result = await client.get_category(5)
     assert result["id"] == "5"
     assert result["name"] == "Feature Requests"
-    await client.close()
 
 
-@respx.mock(base_url=EU_BASE)
 async def test_get_category_tree(respx_mock: respx.MockRouter, client: GainsightClient) -> None:
-    _mock_token(respx_mock)
     tree = {"result": [{"id": "1", "name": "Root", "children": [{"id": "2", "name": "Child"}]}]}
-    respx_mock.get("/v2/category/getTree").mock(
-        return_value=httpx.Response(200, json=tree)
-    )
+    respx_mock.get("/v2/category/getTree").respond(json=tree)
 
     result = await client.get_category_tree()
     assert result["result"][0]["children"][0]["name"] == "Child"
-    await client.close()
 
 
-@respx.mock(base_url=EU_BASE)
 async def test_get_category_topic_counts(respx_mock: respx.MockRouter, client: GainsightClient) -> None:
-    _mock_token(respx_mock)
     counts = {"result": [{"categoryId": "1", "count": 42}]}
-    respx_mock.get("/v2/categories/getVisibleTopicsCount").mock(
-        return_value=httpx.Response(200, json=counts)
-    )
+    respx_mock.get("/v2/categories/getVisibleTopicsCount").respond(json=counts)
 
     result = await client.get_category_topic_counts()
     assert result["result"][0]["count"] == 42
-    await client.close()
 
 
-@respx.mock(base_url=EU_BASE)
 async def test_list_topics_by_category(respx_mock: respx.MockRouter, client: GainsightClient) -> None:
-    _mock_token(respx_mock)
-    respx_mock.get("/v2/categories/3/topics").mock(
-        return_value=httpx.Response(
-            200, json={"result": [{"id": "10", "title": "In category"}]}
-        )
+    respx_mock.get("/v2/categories/3/topics").respond(
+        json={"result": [{"id": "10", "title": "In category"}]}
     )
 
     result = await client.list_topics_by_category(3, {"pageSize": 5})
     assert result["result"][0]["title"] == "In category"
-    await client.close()
-
-
-# ---- Idea statuses & product areas ----
-
-
-@respx.mock(base_url=EU_BASE)
-async def test_list_idea_statuses(respx_mock: respx.MockRouter, client: GainsightClient) -> None:
-    _mock_token(respx_mock)
-    statuses = {"result": [{"id": "1", "name": "Planned", "type": "PLANNED"}]}
-    respx_mock.get("/v2/ideas/ideaStatuses").mock(
-        return_value=httpx.Response(200, json=statuses)
-    )
-
-    result = await client.list_idea_statuses()
-    assert result["result"][0]["name"] == "Planned"
-    await client.close()
-
-
-@respx.mock(base_url=EU_BASE)
-async def test_list_product_areas(respx_mock: respx.MockRouter, client: GainsightClient) -> None:
-    _mock_token(respx_mock)
-    areas = {"result": [{"id": "1", "name": "Platform"}]}
-    respx_mock.get("/v2/productAreas").mock(
-        return_value=httpx.Response(200, json=areas)
-    )
-
-    result = await client.list_product_areas()
-    assert result["result"][0]["name"] == "Platform"
-    await client.close()
 
 
 # ---- Poll results ----
 
 
-@respx.mock(base_url=EU_BASE)
 async def test_get_poll_results(respx_mock: respx.MockRouter, client: GainsightClient) -> None:
-    _mock_token(respx_mock)
     poll = {"title": "Favourite colour?", "votes": [{"option": "Blue", "count": 10}]}
-    respx_mock.get("/v2/questions/7/poll").mock(
-        return_value=httpx.Response(200, json=poll)
-    )
+    respx_mock.get("/v2/questions/7/poll").respond(json=poll)
 
     result = await client.get_poll_results("question", 7)
     assert result["title"] == "Favourite colour?"
     assert result["votes"][0]["count"] == 10
-    await client.close()
-
-
-@respx.mock(base_url=EU_BASE)
-async def test_get_poll_results_invalid_type(client: GainsightClient) -> None:
-    with pytest.raises(ValueError, match="Unknown content type"):
-        await client.get_poll_results("invalid", 1)
 
 
 # ---- Single reply ----
 
 
-@respx.mock(base_url=EU_BASE)
 async def test_get_reply(respx_mock: respx.MockRouter, client: GainsightClient) -> None:
-    _mock_token(respx_mock)
     reply = {"id": "200", "content": "Great answer"}
-    respx_mock.get("/v2/articles/5/replies/200").mock(
-        return_value=httpx.Response(200, json=reply)
-    )
+    respx_mock.get("/v2/articles/5/replies/200").respond(json=reply)
 
     result = await client.get_reply("article", 5, 200)
     assert result["id"] == "200"
     assert result["content"] == "Great answer"
-    await client.close()
-
-
-@respx.mock(base_url=EU_BASE)
-async def test_get_reply_invalid_type(client: GainsightClient) -> None:
-    with pytest.raises(ValueError, match="Unknown content type"):
-        await client.get_reply("invalid", 1, 1)
 
 
 # ---- Topic detail ----
 
 
-@respx.mock(base_url=EU_BASE)
 async def test_get_topic_detail(respx_mock: respx.MockRouter, client: GainsightClient) -> None:
-    _mock_token(respx_mock)
-    respx_mock.get("/v2/questions/42").mock(
-        return_value=httpx.Response(200, json={"id": "42", "title": "Test"})
-    )
+    respx_mock.get("/v2/questions/42").respond(json={"id": "42", "title": "Test"})
 
     result = await client.get_topic_detail("question", 42)
     assert result["id"] == "42"
-    await client.close()
 
 
-@respx.mock(base_url=EU_BASE)
 async def test_get_topic_replies(respx_mock: respx.MockRouter, client: GainsightClient) -> None:
-    _mock_token(respx_mock)
-    respx_mock.get("/v2/conversations/10/replies").mock(
-        return_value=httpx.Response(
-            200,
-            json={"result": [{"id": "100"}], "_metadata": {"totalCount": 1}},
-        )
+    respx_mock.get("/v2/conversations/10/replies").respond(
+        json={"result": [{"id": "100"}], "_metadata": {"totalCount": 1}}
     )
 
     result = await client.get_topic_replies("conversation", 10)
     assert result["result"][0]["id"] == "100"
-    await client.close()
 
 
-@respx.mock(base_url=EU_BASE)
+async def test_try_get_topic_replies_error_returns_empty(
+    respx_mock: respx.MockRouter, client: GainsightClient
+) -> None:
+    respx_mock.get("/v2/articles/10/replies").respond(404)
+
+    result = await client.try_get_topic_replies("article", 10)
+    assert result == {"result": [], "_metadata": {"totalCount": 0}}
+
+
 async def test_get_topic_by_id(respx_mock: respx.MockRouter, client: GainsightClient) -> None:
-    _mock_token(respx_mock)
-    respx_mock.get("/v2/topics").mock(
-        return_value=httpx.Response(
-            200,
-            json={"result": [{"id": "42", "contentType": "question"}]},
-        )
+    respx_mock.get("/v2/topics").respond(
+        json={"result": [{"id": "42", "contentType": "question"}]}
     )
 
     result = await client.get_topic_by_id(42)
     assert result["result"][0]["contentType"] == "question"
-    await client.close()
 
 
-# ---- Region tests ----
+# ---- Content type validation ----
 
 
-def test_eu_region_base_url(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setenv("GS_CC_REGION", "eu-west-1")
-    client = GainsightClient()
-    assert client.base_url == "https://api2-eu-west-1.insided.com"
+@pytest.mark.parametrize(
+    ("method", "args"),
+    [
+        ("get_topic_detail", ("invalid", 1)),
+        ("get_topic_replies", ("invalid", 1)),
+        ("get_poll_results", ("invalid", 1)),
+        ("get_reply", ("invalid", 1, 1)),
+    ],
+)
+async def test_unknown_content_type_raises(
+    client: GainsightClient, method: str, args: tuple[object, ...]
+) -> None:
+    with pytest.raises(ValueError, match="Unknown content type"):
+        await getattr(client, method)(*args)
 
 
-def test_us_region_base_url(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setenv("GS_CC_REGION", "us-west-2")
-    client = GainsightClient()
-    assert client.base_url == "https://api2-us-west-2.insided.com"
+# ---- Region tests ----
+
+
+@pytest.mark.parametrize(
+    ("region", "expected"),
+    [
+        ("eu-west-1", "https://api2-eu-west-1.insided.com"),
+        ("us-west-2", "https://api2-us-west-2.insided.com"),
+    ],
+)
+def test_region_base_url(
+    monkeypatch: pytest.MonkeyPatch, region: str, expected: str
+) -> None:
+    monkeypatch.setenv("GS_CC_REGION", region)
+    assert GainsightClient().base_url == expected
 
 
 def test_default_region_is_eu(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -412,31 +519,118 @@ def test_default_region_is_eu(monkeypatch: pytest.MonkeyPatch) -> None:
     assert client.base_url == "https://api2-eu-west-1.insided.com"
 
 
-@respx.mock(base_url=US_BASE)
-async def test_us_region_api_call(
-    respx_mock: respx.MockRouter, monkeypatch: pytest.MonkeyPatch
-) -> None:
+async def test_us_region_api_call(monkeypatch: pytest.MonkeyPatch) -> None:
     """Verify US region client sends requests to the correct base URL."""
     monkeypatch.setenv("GS_CC_REGION", "us-west-2")
     us_client = GainsightClient()
 
-    respx_mock.post("/oauth2/token").mock(
-        return_value=httpx.Response(
-            200, json={"access_token": "tok-us", "expires_in": 3600}
+    with respx.mock(base_url=US_BASE) as us_mock:
+        us_mock.post("/oauth2/token").respond(
+            json={"access_token": "tok-us", "expires_in": 3600}
         )
-    )
-    respx_mock.get("/v2/categories").mock(
-        return_value=httpx.Response(
-            200, json={"result": [{"id": "1", "name": "US Category"}]}
+        us_mock.get("/v2/categories").respond(
+            json={"result": [{"id": "1", "name": "US Category"}]}
         )
-    )
 
-    result = await us_client.list_categories()
+        result = await us_client.list_categories()
     assert result["result"][0]["name"] == "US Category"
     await us_client.close()
 
 
-# ---- Error cases ----
+# ---- Response cache ----
+
+
+async def test_reference_data_is_cached(
+    respx_mock: respx.MockRouter, client: GainsightClient
+) -> None:
+    route = respx_mock.get("/v2/categories").respond(json={"result": [{"id": "1"}]})
+
+    first = await client.list_categories()
+    second = await client.list_categories()
+
+    assert first == second
+    assert route.call_count == 1
+
+
+async def test_uncached_call_bypasses_cache(
+    respx_mock: respx.MockRouter, client: GainsightClient
+) -> None:
+    route = respx_mock.get("/v2/category/getTree").respond(json={"result": []})
+
+    await client.get_category_tree()
+    await client.get_category_tree(cache=False)
+    await client.get_category_tree(cache=False)
+
+    assert route.call_count == 3
+    assert len(client._cache) == 1
+
+
+async def test_cache_is_keyed_by_params(
+    respx_mock: respx.MockRouter, client: GainsightClient
+) -> None:
+    route = respx_mock.get("/v2/tags").respond(json={"result": []})
+
+    await client.list_tags({"page": 1})
+    await client.list_tags({"page": 2})
+    await client.list_tags({"page": 1})
+
+    assert route.call_count == 2
+
+
+async def test_cache_entry_expires(
+    respx_mock: respx.MockRouter, client: GainsightClient
+) -> None:
+    route = respx_mock.get("/v2/productAreas").respond(json={"result": []})
+
+    client._cache.ttl = 0.0
+    await client.list_product_areas()
+    await client.list_product_areas()
+
+    assert route.call_count == 2
+
+
+async def test_clear_cache(respx_mock: respx.MockRouter, client: GainsightClient) -> None:
+    route = respx_mock.get("/v2/ideas/ideaStatuses").respond(json={"result": []})
+
+    await client.list_idea_statuses()
+    client.clear_cache()
+    await client.list_idea_statuses()
+
+    assert route.call_count == 2
+
+
+# ---- Shared connection pool ----
+
+
+def test_clients_share_http_pool_per_region() -> None:
+    eu_a = GainsightClient(region="eu-west-1")
+    eu_b = GainsightClient(region="eu-west-1")
+    us = GainsightClient(region="us-west-2")
+    assert eu_a._http is eu_b._http
+    assert eu_a._http is not us._http
+
+
+async def test_client_close_stops_refresh_but_keeps_shared_pool() -> None:
+    client = GainsightClient()
+    await client.list_categories()
+    refresh_task = client._refresh_task
+    assert refresh_task is not None
+
+    await client.close()
+
+    assert refresh_task.cancelled()
+    assert client._refresh_task is None
+    assert not client._http.is_closed
+
+
+async def test_aclose_http_clients_recreates_pool_on_next_use() -> None:
+    first = GainsightClient()._http
+    await aclose_http_clients()
+    assert first.is_closed
+
+    second = GainsightClient()._http
+    assert second is not first
+    assert not second.is_closed
 
 
 # ---- Community URL tests ----
@@ -467,8 +661,3 @@ def test_invalid_region(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("GS_CC_REGION", "ap-southeast-1")
     with pytest.raises(ValueError, match="Unknown region"):
         GainsightClient()
-
-
-async def test_invalid_content_type(client: GainsightClient) -> None:
-    with pytest.raises(ValueError, match="Unknown content type"):
-        await client.get_topic_detail("invalid", 1)
@@ -2,23 +2,38 @@
 
 from __future__ import annotations
 
-import json
-from unittest.mock import AsyncMock, patch
-
+import asyncio
+import inspect
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+from unittest.mock import AsyncMock, call
+
+import httpx
 import pytest
+from hypothesis import HealthCheck, given, settings
+from hypothesis import strategies as st
+
+try:
+    from orjson import loads
+except ImportError:  # pragma: no cover - optional speed-up
+    from json import loads
 
 from src import server as server_module
 from src.server import (
     search_community,
     search_tags,
     list_topics,
+    list_topics_all,
     get_topic,
+    get_topics_bulk,
     list_ideas,
     list_categories,
     list_tags,
     get_category,
     get_category_tree,
     get_category_topic_counts,
+    community_overview,
     list_topics_by_category,
     list_idea_statuses,
     list_product_areas,
@@ -30,8 +45,11 @@ from src.server import (
 
 @pytest.fixture(autouse=True)
 def _reset_client() -> None:
-    """Reset the module-level client between tests."""
+    """Reset the module-level client and caches between tests."""
     server_module._client = None
+    server_module._topic_types.clear()
+    server_module._tool_cache.clear()
+    server_module._community_info = None
 
 
 def _make_client_mock() -> AsyncMock:
@@ -40,457 +58,805 @@ def _make_client_mock() -> AsyncMock:
     return mock
 
 
-# ---- search_community ----
+# Building an AsyncMock is slow, so the mock_client fixture resets one
+# shared instance instead. reset_mock recurses into child mocks but leaves
+# plain attributes alone, so the ones tests assign are restored here too.
+_PROTOTYPE = _make_client_mock()
+
+
+@pytest.fixture
+def mock_client(monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
+    """A client mock installed as the server's shared client for one test."""
+    _PROTOTYPE.reset_mock(return_value=True, side_effect=True)
+    for name in ("region", "base_url"):
+        _PROTOTYPE.__dict__.pop(name, None)
+    _PROTOTYPE.community_url = None
+    monkeypatch.setattr(server_module, "_client", _PROTOTYPE)
+    return _PROTOTYPE
 
 
-async def test_search_community() -> None:
+# ---- lifespan ----
+
+
+async def test_lifespan_creates_and_closes_client(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
     mock = _make_client_mock()
-    mock.search.return_value = {"community": [{"id": "1"}]}
+    aclose = AsyncMock()
+    monkeypatch.setattr(server_module, "GainsightClient", lambda: mock)
+    monkeypatch.setattr(server_module, "aclose_http_clients", aclose)
+
+    async with server_module._lifespan(server_module.mcp):
+        assert server_module._client is mock
+
+    mock.close.assert_awaited_once()
+    aclose.assert_awaited_once()
+    assert server_module._client is None
+
+
+# ---- tool registration ----
+
+
+async def test_tools_return_text_only() -> None:
+    """Results are sent once as text, not duplicated as structured content."""
+    tools = await server_module.mcp.list_tools()
+    assert tools
+    assert all(tool.outputSchema is None for tool in tools)
+
+
+# ---- client singleton ----
+
+
+async def test_concurrent_tool_calls_share_one_client(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    created: list[AsyncMock] = []
+
+    def factory() -> AsyncMock:
+        mock = _make_client_mock()
+        mock.list_topics.return_value = {"result": []}
+        created.append(mock)
+        return mock
+
+    monkeypatch.setattr(server_module, "GainsightClient", factory)
+
+    await asyncio.gather(*(list_topics() for _ in range(10)))
+
+    assert len(created) == 1
+    assert created[0].list_topics.call_count == 10
+
+
+# ---- serialisation ----
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_is_compact(use_orjson: bool, monkeypatch: pytest.MonkeyPatch) -> None:
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(server_module, "orjson", None)
+
+    assert server_module._dumps({"a": [1, 2], "b": "café"}) == '{"a":[1,2],"b":"café"}'
+
+
+def test_err_matches_dumps() -> None:
+    message = 'Topic "5" not found — café\n'
+    assert server_module._err(message) == server_module._dumps({"error": message})
+    assert loads(server_module._err(message)) == {"error": message}
+
+
+def test_params_skips_none_values() -> None:
+    params = server_module._params(("q", "sso"), ("page", None), ("hasAnswer", False))
+    assert params == {"q": "sso", "hasAnswer": False}
+
+
+# ---- pass-through tools ----
+
+
+# (tool, kwargs, client method, expected client call, payload). Tools with
+# their own output cache skip the client's response cache.
+_PASSTHROUGH_CASES = [
+    (search_tags, {"query": "api"}, "search_tags", call({"q": "api"}),
+     {"tags": [{"id": "1", "name": "api", "count": 42}]}),
+    (list_ideas, {}, "list_ideas", call({}),
+     {"result": [{"id": "7", "contentType": "idea"}]}),
+    (list_categories, {}, "list_categories", call(cache=False),
+     {"result": [{"id": "1", "name": "General"}]}),
+    (list_tags, {}, "list_tags", call({}, cache=False),
+     {"result": [{"id": "1", "name": "api"}]}),
+    (get_category, {"category_id": 5}, "get_category", call(5, cache=False),
+     {"id": "5", "name": "Feature Requests"}),
+    (get_category_tree, {}, "get_category_tree", call(cache=False),
+     {"result": [{"id": "1", "name": "Root", "children": []}]}),
+    (get_category_topic_counts, {}, "get_category_topic_counts", call(),
+     {"result": [{"categoryId": "1", "count": 42}]}),
+    (list_topics_by_category, {"category_id": 3}, "list_topics_by_category", call(3, {}),
+     {"result": [{"id": "10", "title": "In category"}]}),
+    (list_idea_statuses, {}, "list_idea_statuses", call(cache=False),
+     {"result": [{"id": "1", "name": "Planned"}]}),
+    (list_product_areas, {}, "list_product_areas", call(cache=False),
+     {"result": [{"id": "1", "name": "Platform"}]}),
+    (get_poll_results, {"topic_id": 7, "content_type": "question"}, "get_poll_results",
+     call("question", 7), {"title": "Best feature?", "votes": [{"option": "Search", "count": 15}]}),
+    (get_reply, {"topic_id": 5, "reply_id": 200, "content_type": "article"}, "get_reply",
+     call("article", 5, 200), {"id": "200", "content": "Helpful answer"}),
+]
+
+
+@pytest.mark.parametrize(
+    ("tool", "kwargs", "method", "expected_call", "payload"),
+    _PASSTHROUGH_CASES,
+    ids=[case[0].__name__ for case in _PASSTHROUGH_CASES],
+)
+async def test_passthrough_tool(
+    mock_client: AsyncMock,
+    tool: Callable[..., Awaitable[str]],
+    kwargs: dict[str, Any],
+    method: str,
+    expected_call: Any,
+    payload: Any,
+) -> None:
+    getattr(mock_client, method).return_value = payload
+
+    result = loads(await tool(**kwargs))
+
+    assert result == payload
+    assert getattr(mock_client, method).call_args_list == [expected_call]
 
-    with patch.object(server_module, "_client", mock):
-        result = json.loads(await search_community(query="SSO"))
+
+# ---- search_community ----
+
+
+_EXPECTED_SEARCH_FILTERS = {
+    "q": "SSO",
+    "categoryIds": "1,2",
+    "contentTypes": "question",
+    "tags": "api,sso",
+    "moderatorTags": "internal",
+    "hasAnswer": True,
+}
+
+
+async def test_search_community(mock_client: AsyncMock) -> None:
+    mock_client.search.return_value = {"community": [{"id": "1"}]}
+
+    result = loads(await search_community(query="SSO"))
 
     assert result["community"][0]["id"] == "1"
-    mock.search.assert_called_once_with({"q": "SSO"})
+    mock_client.search.assert_called_once_with({"q": "SSO"})
 
 
-async def test_search_community_with_pagination() -> None:
-    mock = _make_client_mock()
-    mock.search.return_value = {"community": []}
+async def test_search_community_with_pagination(mock_client: AsyncMock) -> None:
+    mock_client.search.return_value = {"community": []}
 
-    with patch.object(server_module, "_client", mock):
-        result = json.loads(await search_community(query="api", page=2))
+    result = loads(await search_community(query="api", page=2))
 
     assert result == {"community": []}
-    mock.search.assert_called_once_with({"q": "api", "page": 2})
+    mock_client.search.assert_called_once_with({"q": "api", "page": 2})
 
 
-async def test_search_community_with_filters() -> None:
-    mock = _make_client_mock()
-    mock.search.return_value = {"community": [{"id": "2", "contentType": "question"}]}
-
-    with patch.object(server_module, "_client", mock):
-        result = json.loads(
-            await search_community(
-                query="SSO",
-                category_ids="1,2",
-                content_types="question",
-                tags="api,sso",
-                moderator_tags="internal",
-                has_answer=True,
-            )
+async def test_search_community_with_filters(mock_client: AsyncMock) -> None:
+    mock_client.search.return_value = {"community": [{"id": "2", "contentType": "question"}]}
+
+    result = loads(
+        await search_community(
+            query="SSO",
+            category_ids="1,2",
+            content_types="question",
+            tags="api,sso",
+            moderator_tags="internal",
+            has_answer=True,
         )
+    )
 
     assert result["community"][0]["contentType"] == "question"
-    call_params = mock.search.call_args[0][0]
-    assert call_params["q"] == "SSO"
-    assert call_params["categoryIds"] == "1,2"
-    assert call_params["contentTypes"] == "question"
-    assert call_params["tags"] == "api,sso"
-    assert call_params["moderatorTags"] == "internal"
-    assert call_params["hasAnswer"] is True
+    mock_client.search.assert_called_once_with(_EXPECTED_SEARCH_FILTERS)
 
 
-async def test_search_community_none_filters_excluded() -> None:
-    mock = _make_client_mock()
-    mock.search.return_value = {"community": []}
+async def test_search_community_none_filters_excluded(mock_client: AsyncMock) -> None:
+    mock_client.search.return_value = {"community": []}
 
-    with patch.object(server_module, "_client", mock):
-        await search_community(query="test")
+    await search_community(query="test")
 
-    call_params = mock.search.call_args[0][0]
+    call_params = mock_client.search.call_args[0][0]
     assert "categoryIds" not in call_params
     assert "contentTypes" not in call_params
     assert "tags" not in call_params
     assert "hasAnswer" not in call_params
 
 
-# ---- search_tags ----
+async def test_search_community_caches_repeated_queries(mock_client: AsyncMock) -> None:
+    mock_client.search.return_value = {"community": [{"id": "1"}]}
 
+    first = await search_community(query="SSO", page=1)
+    second = await search_community(query="SSO", page=1)
+    await search_community(query="SSO", page=2)
 
-async def test_search_tags_tool() -> None:
-    mock = _make_client_mock()
-    mock.search_tags.return_value = {"tags": [{"id": "1", "name": "api", "count": 42}]}
+    assert first == second
+    assert mock_client.search.call_count == 2
+    entry = server_module._tool_cache._data[
+        ("search_community", frozenset({"q": "SSO", "page": 1}.items()))
+    ]
+    assert entry[0] > time.monotonic() + server_module._TOOL_CACHE_TTL
 
-    with patch.object(server_module, "_client", mock):
-        result = json.loads(await search_tags(query="api"))
 
-    assert result["tags"][0]["name"] == "api"
-    assert result["tags"][0]["count"] == 42
-    mock.search_tags.assert_called_once_with({"q": "api"})
+# ---- search_tags ----
 
 
-async def test_search_tags_with_pagination() -> None:
-    mock = _make_client_mock()
-    mock.search_tags.return_value = {"tags": []}
+async def test_search_tags_with_pagination(mock_client: AsyncMock) -> None:
+    mock_client.search_tags.return_value = {"tags": []}
 
-    with patch.object(server_module, "_client", mock):
-        await search_tags(query="test", page=2)
+    await search_tags(query="test", page=2)
 
-    mock.search_tags.assert_called_once_with({"q": "test", "page": 2})
+    mock_client.search_tags.assert_called_once_with({"q": "test", "page": 2})
 
 
 # ---- list_topics ----
 
 
-async def test_list_topics_no_filter() -> None:
-    mock = _make_client_mock()
-    mock.list_topics.return_value = {"result": [{"id": "5"}]}
+_EXPECTED_TOPIC_FILTERS = {"categoryIds": "1,2", "tags": "api,sso", "pageSize": 5}
+
+
+async def test_list_topics_no_filter(mock_client: AsyncMock) -> None:
+    mock_client.list_topics.return_value = {"result": [{"id": "5"}]}
 
-    with patch.object(server_module, "_client", mock):
-        result = json.loads(await list_topics())
+    result = loads(await list_topics())
 
     assert result["result"][0]["id"] == "5"
-    mock.list_topics.assert_called_once()
+    mock_client.list_topics.assert_called_once()
 
 
-async def test_list_topics_filtered_by_question() -> None:
-    mock = _make_client_mock()
-    mock.list_questions.return_value = {"result": [{"contentType": "question"}]}
+async def test_list_topics_filtered_by_question(mock_client: AsyncMock) -> None:
+    mock_client.list_questions.return_value = {"result": [{"contentType": "question"}]}
 
-    with patch.object(server_module, "_client", mock):
-        result = json.loads(await list_topics(content_type="question"))
+    result = loads(await list_topics(content_type="question"))
 
     assert result["result"][0]["contentType"] == "question"
-    mock.list_questions.assert_called_once()
+    mock_client.list_questions.assert_called_once()
 
 
-async def test_list_topics_filtered_by_article() -> None:
-    mock = _make_client_mock()
-    mock.list_articles.return_value = {"result": [{"contentType": "article"}]}
+async def test_list_topics_filtered_by_article(mock_client: AsyncMock) -> None:
+    mock_client.list_articles.return_value = {"result": [{"contentType": "article"}]}
 
-    with patch.object(server_module, "_client", mock):
-        result = json.loads(await list_topics(content_type="article"))
+    result = loads(await list_topics(content_type="article"))
 
-    mock.list_articles.assert_called_once()
+    mock_client.list_articles.assert_called_once()
 
 
-async def test_list_topics_with_category_and_tag_filters() -> None:
-    mock = _make_client_mock()
-    mock.list_topics.return_value = {"result": [{"id": "10"}]}
+async def test_list_topics_unknown_content_type_uses_unified_endpoint(
+    mock_client: AsyncMock,
+) -> None:
+    mock_client.list_topics.return_value = {"result": []}
 
-    with patch.object(server_module, "_client", mock):
-        result = json.loads(
-            await list_topics(category_ids="1,2", tags="api,sso", page_size=5)
-        )
+    await list_topics(content_type="poll", page=2)
+
+    mock_client.list_topics.assert_called_once_with({"page": 2})
+
+
+async def test_list_topics_with_category_and_tag_filters(mock_client: AsyncMock) -> None:
+    mock_client.list_topics.return_value = {"result": [{"id": "10"}]}
+
+    result = loads(
+        await list_topics(category_ids="1,2", tags="api,sso", page_size=5)
+    )
 
     assert result["result"][0]["id"] == "10"
-    call_params = mock.list_topics.call_args[0][0]
-    assert call_params["categoryIds"] == "1,2"
-    assert call_params["tags"] == "api,sso"
-    assert call_params["pageSize"] == 5
+    mock_client.list_topics.assert_called_once_with(_EXPECTED_TOPIC_FILTERS)
 
 
-async def test_list_topics_with_date_filters() -> None:
-    mock = _make_client_mock()
-    mock.list_topics.return_value = {"result": []}
+async def test_list_topics_with_date_filters(mock_client: AsyncMock) -> None:
+    mock_client.list_topics.return_value = {"result": []}
 
-    with patch.object(server_module, "_client", mock):
-        await list_topics(created_after="2024-01-01", active_before="2024-06-01")
+    await list_topics(created_after="2024-01-01", active_before="2024-06-01")
 
-    call_params = mock.list_topics.call_args[0][0]
-    assert "createdAt" in call_params
-    assert "lastActivity" in call_params
-    created = json.loads(call_params["createdAt"])
-    assert created == {"from": "2024-01-01"}
-    activity = json.loads(call_params["lastActivity"])
-    assert activity == {"to": "2024-06-01"}
+    mock_client.list_topics.assert_called_once_with(
+        {
+            "createdAt": '{"from":"2024-01-01"}',
+            "lastActivity": '{"to":"2024-06-01"}',
+        }
+    )
 
 
-async def test_list_topics_with_sort_and_content_types() -> None:
-    mock = _make_client_mock()
-    mock.list_topics.return_value = {"result": []}
+async def test_list_topics_with_sort_and_content_types(mock_client: AsyncMock) -> None:
+    mock_client.list_topics.return_value = {"result": []}
 
-    with patch.object(server_module, "_client", mock):
-        await list_topics(content_types="question,idea", sort="createdAt")
+    await list_topics(content_types="question,idea", sort="createdAt")
 
-    call_params = mock.list_topics.call_args[0][0]
+    call_params = mock_client.list_topics.call_args[0][0]
     assert call_params["contentTypes"] == "question,idea"
     assert call_params["sort"] == "createdAt"
 
 
-# ---- get_topic ----
+async def test_list_topics_prefetch_pages_merges_results(mock_client: AsyncMock) -> None:
+    mock_client.list_topics.side_effect = lambda params: {
+        "result": [{"id": str(params["page"])}],
+        "_metadata": {"totalCount": 3, "page": params["page"]},
+    }
 
+    result = loads(await list_topics(page=2, prefetch_pages=2))
 
-async def test_get_topic_tool() -> None:
-    mock = _make_client_mock()
-    mock.get_topic_by_id.return_value = {
-        "result": [{"id": "42", "contentType": "question"}]
-    }
-    mock.get_topic_detail.return_value = {
-        "id": "42",
-        "title": "Test topic",
-        "contentType": "question",
-    }
-    mock.get_topic_replies.return_value = {
-        "result": [{"id": "100", "body": "Reply"}],
-        "_metadata": {"totalCount": 1},
-    }
+    assert [t["id"] for t in result["result"]] == ["2", "3"]
+    assert result["_metadata"]["page"] == 2
+    pages = [call.args[0]["page"] for call in mock_client.list_topics.call_args_list]
+    assert sorted(pages) == [2, 3]
 
-    with patch.object(server_module, "_client", mock):
-        result = json.loads(await get_topic(topic_id=42))
 
-    assert result["id"] == "42"
-    assert result["replies"]["result"][0]["id"] == "100"
-    mock.get_topic_by_id.assert_called_once_with(42)
-    mock.get_topic_detail.assert_called_once_with("question", 42)
-    mock.get_topic_replies.assert_called_once_with("question", 42)
+async def test_list_topics_prefetch_pages_is_capped(mock_client: AsyncMock) -> None:
+    mock_client.list_questions.return_value = {"result": []}
 
+    await list_topics(content_type="question", prefetch_pages=50)
 
-async def test_get_topic_not_found() -> None:
-    mock = _make_client_mock()
-    mock.get_topic_by_id.return_value = {"result": []}
+    assert mock_client.list_questions.call_count == server_module._MAX_PAGES
 
-    with patch.object(server_module, "_client", mock):
-        result = json.loads(await get_topic(topic_id=9999))
 
-    assert "error" in result
+# ---- list_topics_all ----
 
 
-# ---- list_ideas ----
+async def test_list_topics_all_tool(mock_client: AsyncMock) -> None:
+    mock_client.list_all_topics.return_value = {"result": [{"id": "1"}, {"id": "2"}]}
 
+    result = loads(
+        await list_topics_all(tags="api", created_after="2024-01-01", max_pages=3)
+    )
 
-async def test_list_ideas_tool() -> None:
-    mock = _make_client_mock()
-    mock.list_ideas.return_value = {"result": [{"id": "7", "contentType": "idea"}]}
+    assert len(result["result"]) == 2
+    mock_client.list_all_topics.assert_called_once_with(
+        {"tags": "api", "createdAt": '{"from":"2024-01-01"}'},
+        max_pages=3,
+    )
 
-    with patch.object(server_module, "_client", mock):
-        result = json.loads(await list_ideas())
 
-    assert result["result"][0]["contentType"] == "idea"
-    mock.list_ideas.assert_called_once()
+async def test_list_topics_all_clamps_max_pages(mock_client: AsyncMock) -> None:
+    mock_client.list_all_topics.return_value = {"result": []}
 
+    await list_topics_all(max_pages=50)
 
-# ---- list_categories ----
+    mock_client.list_all_topics.assert_called_once_with({}, max_pages=10)
 
 
-async def test_list_categories_tool() -> None:
-    mock = _make_client_mock()
-    mock.list_categories.return_value = {
-        "result": [{"id": "1", "name": "General"}]
+# ---- topic filter dispatch ----
+
+
+# Tool argument -> API query param for the filters shared by the topic tools.
+_TOPIC_FILTER_PARAMS = {
+    "category_ids": "categoryIds",
+    "tags": "tags",
+    "moderator_tags": "moderatorTags",
+    "content_types": "contentTypes",
+    "sort": "sort",
+    "page_size": "pageSize",
+}
+
+# tool -> (client method, leading positional args, fixed tool kwargs, fixed client kwargs)
+_TOPIC_DISPATCH = {
+    list_topics: ("list_topics", (), {}, {}),
+    list_topics_all: ("list_all_topics", (), {"max_pages": 2}, {"max_pages": 2}),
+    list_topics_by_category: ("list_topics_by_category", (3,), {"category_id": 3}, {}),
+}
+
+_filter_text = st.none() | st.text(alphabet="abc,-_0123456789", max_size=12)
+_filter_date = st.none() | st.just("") | st.dates().map(str)
+
+
+def _expected_topic_params(kwargs: dict[str, Any]) -> dict[str, Any]:
+    expected = {
+        _TOPIC_FILTER_PARAMS[name]: value
+        for name, value in kwargs.items()
+        if name in _TOPIC_FILTER_PARAMS and value is not None
     }
+    for param, start, end in (
+        ("createdAt", "created_after", "created_before"),
+        ("lastActivity", "active_after", "active_before"),
+    ):
+        bounds = {
+            bound: kwargs[name]
+            for bound, name in (("from", start), ("to", end))
+            if kwargs[name]
+        }
+        if bounds:
+            # The exact compact form sent to the API, spelled out rather
+            # than built with the _dumps under test
+            expected[param] = "{" + ",".join(f'"{k}":"{v}"' for k, v in bounds.items()) + "}"
+    return expected
+
+
+@settings(max_examples=50, suppress_health_check=[HealthCheck.function_scoped_fixture])
+@given(
+    tool=st.sampled_from(list(_TOPIC_DISPATCH)),
+    kwargs=st.fixed_dictionaries(
+        {
+            "category_ids": _filter_text,
+            "tags": _filter_text,
+            "moderator_tags": _filter_text,
+            "content_types": _filter_text,
+            "sort": st.none() | st.sampled_from(["createdAt", "lastActivity"]),
+            "page_size": st.none() | st.integers(min_value=1, max_value=100),
+            "created_after": _filter_date,
+            "created_before": _filter_date,
+            "active_after": _filter_date,
+            "active_before": _filter_date,
+        }
+    ),
+)
+async def test_topic_filters_dispatch(
+    mock_client: AsyncMock, tool: Callable[..., Awaitable[str]], kwargs: dict[str, Any]
+) -> None:
+    method, args, tool_kwargs, client_kwargs = _TOPIC_DISPATCH[tool]
+    # list_topics_by_category has no category_ids/content_types filters
+    accepted = inspect.signature(tool).parameters
+    kwargs = {name: value for name, value in kwargs.items() if name in accepted}
+    mock_client.reset_mock(return_value=True, side_effect=True)
+    getattr(mock_client, method).return_value = {"result": []}
 
-    with patch.object(server_module, "_client", mock):
-        result = json.loads(await list_categories())
+    await tool(**tool_kwargs, **kwargs)
 
-    assert result["result"][0]["name"] == "General"
+    getattr(mock_client, method).assert_called_once_with(
+        *args, _expected_topic_params(kwargs), **client_kwargs
+    )
 
 
-# ---- list_tags ----
+# ---- get_topic ----
 
 
-async def test_list_tags_tool() -> None:
-    mock = _make_client_mock()
-    mock.list_tags.return_value = {"result": [{"id": "1", "name": "api"}]}
+def _mock_topic(
+    mock: AsyncMock,
+    topic_id: int,
+    content_type: str,
+    *,
+    detail: dict[str, Any] | None = None,
+    replies: dict[str, Any] | None = None,
+) -> None:
+    """Configure the lookup, detail and replies calls for one topic."""
+    mock.get_topic_by_id.return_value = {
+        "result": [{"id": str(topic_id), "contentType": content_type}]
+    }
+    mock.get_topic_detail.return_value = detail or {
+        "id": str(topic_id),
+        "contentType": content_type,
+    }
+    mock.try_get_topic_replies.return_value = replies or {"result": []}
 
-    with patch.object(server_module, "_client", mock):
-        result = json.loads(await list_tags())
 
-    assert result["result"][0]["name"] == "api"
-    mock.list_tags.assert_called_once()
+def _http_error(status_code: int) -> httpx.HTTPStatusError:
+    request = httpx.Request("GET", "https://api2-eu-west-1.insided.com/v2/questions/1")
+    response = httpx.Response(status_code, request=request)
+    return httpx.HTTPStatusError(f"{status_code}", request=request, response=response)
 
 
-async def test_list_tags_with_pagination() -> None:
-    mock = _make_client_mock()
-    mock.list_tags.return_value = {"result": []}
+async def test_get_topic_tool(mock_client: AsyncMock) -> None:
+    _mock_topic(
+        mock_client,
+        42,
+        "question",
+        detail={"id": "42", "title": "Test topic", "contentType": "question"},
+        replies={"result": [{"id": "100", "body": "Reply"}], "_metadata": {"totalCount": 1}},
+    )
 
-    with patch.object(server_module, "_client", mock):
-        await list_tags(page=2, page_size=10)
+    result = loads(await get_topic(topic_id=42))
 
-    mock.list_tags.assert_called_once_with({"page": 2, "pageSize": 10})
+    assert result["id"] == "42"
+    assert result["replies"]["result"][0]["id"] == "100"
+    mock_client.get_topic_by_id.assert_called_once_with(42)
+    mock_client.get_topic_detail.assert_called_once_with("question", 42)
+    mock_client.try_get_topic_replies.assert_called_once_with("question", 42)
 
 
-# ---- get_category ----
+async def test_get_topic_not_found(mock_client: AsyncMock) -> None:
+    mock_client.get_topic_by_id.return_value = {"result": []}
 
+    result = loads(await get_topic(topic_id=9999))
 
-async def test_get_category_tool() -> None:
-    mock = _make_client_mock()
-    mock.get_category.return_value = {"id": "5", "name": "Feature Requests"}
+    assert "error" in result
 
-    with patch.object(server_module, "_client", mock):
-        result = json.loads(await get_category(category_id=5))
 
-    assert result["name"] == "Feature Requests"
-    mock.get_category.assert_called_once_with(5)
+async def test_get_topic_with_content_type_skips_lookup(mock_client: AsyncMock) -> None:
+    _mock_topic(mock_client, 42, "idea")
 
+    result = loads(await get_topic(topic_id=42, content_type="idea"))
 
-# ---- get_category_tree ----
+    assert result["id"] == "42"
+    mock_client.get_topic_by_id.assert_not_called()
+    mock_client.get_topic_detail.assert_called_once_with("idea", 42)
+    mock_client.try_get_topic_replies.assert_called_once_with("idea", 42)
 
 
-async def test_get_category_tree_tool() -> None:
-    mock = _make_client_mock()
-    tree = {"result": [{"id": "1", "name": "Root", "children": []}]}
-    mock.get_category_tree.return_value = tree
+async def test_get_topic_remembers_content_type(mock_client: AsyncMock) -> None:
+    _mock_topic(mock_client, 42, "question")
 
-    with patch.object(server_module, "_client", mock):
-        result = json.loads(await get_category_tree())
+    await get_topic(topic_id=42)
+    await get_topic(topic_id=42)
 
-    assert result["result"][0]["name"] == "Root"
-    mock.get_category_tree.assert_called_once()
+    mock_client.get_topic_by_id.assert_called_once_with(42)
+    assert mock_client.get_topic_detail.call_count == 2
 
 
-# ---- get_category_topic_counts ----
+async def test_get_topic_stale_content_type_falls_back_to_lookup(
+    mock_client: AsyncMock,
+) -> None:
+    server_module._remember_topic_type(42, "question")
+    _mock_topic(mock_client, 42, "idea")
 
+    async def detail(content_type: str, topic_id: int) -> dict[str, str]:
+        if content_type != "idea":
+            raise _http_error(404)
+        return {"id": str(topic_id), "contentType": content_type}
 
-async def test_get_category_topic_counts_tool() -> None:
-    mock = _make_client_mock()
-    mock.get_category_topic_counts.return_value = {
-        "result": [{"categoryId": "1", "count": 42}]
-    }
+    mock_client.get_topic_detail.side_effect = detail
 
-    with patch.object(server_module, "_client", mock):
-        result = json.loads(await get_category_topic_counts())
+    result = loads(await get_topic(topic_id=42))
 
-    assert result["result"][0]["count"] == 42
-    mock.get_category_topic_counts.assert_called_once()
+    assert result["contentType"] == "idea"
+    mock_client.get_topic_by_id.assert_called_once_with(42)
+    assert server_module._topic_types[42] == "idea"
 
 
-# ---- list_topics_by_category ----
+async def test_get_topic_stale_content_type_not_found(mock_client: AsyncMock) -> None:
+    server_module._remember_topic_type(42, "question")
+    mock_client.get_topic_detail.side_effect = _http_error(404)
+    mock_client.get_topic_by_id.return_value = {"result": []}
 
+    result = loads(await get_topic(topic_id=42))
 
-async def test_list_topics_by_category_tool() -> None:
-    mock = _make_client_mock()
-    mock.list_topics_by_category.return_value = {
-        "result": [{"id": "10", "title": "In category"}]
+    assert result == {"error": "Topic 42 not found"}
+    assert 42 not in server_module._topic_types
+
+
+def test_topic_type_cache_is_bounded(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(server_module, "_TOPIC_TYPE_CACHE_SIZE", 2)
+
+    server_module._remember_topic_type(1, "question")
+    server_module._remember_topic_type(2, "idea")
+    server_module._remember_topic_type(3, "article")
+
+    assert list(server_module._topic_types) == [2, 3]
+
+
+# ---- get_topics_bulk ----
+
+
+async def test_get_topics_bulk_fetches_each_topic(mock_client: AsyncMock) -> None:
+    mock_client.get_topic_by_id.side_effect = lambda topic_id: {
+        "result": [] if topic_id == 3 else [{"contentType": "question"}]
     }
+    mock_client.get_topic_detail.side_effect = lambda _, topic_id: {"id": str(topic_id)}
+    mock_client.try_get_topic_replies.return_value = {"result": []}
+
+    result = loads(await get_topics_bulk(topic_ids=[1, 2, 3]))
+
+    assert result["result"] == [
+        {"id": "1", "replies": {"result": []}},
+        {"id": "2", "replies": {"result": []}},
+        {"id": 3, "error": "Topic 3 not found"},
+    ]
+    assert mock_client.get_topic_detail.call_count == 2
+
+
+@pytest.mark.parametrize(
+    ("exc", "reason"),
+    [
+        (_http_error(403), "HTTP 403"),
+        (httpx.ReadTimeout("timed out"), "ReadTimeout"),
+        (ValueError("Unknown content type 'poll'"), "Unknown content type 'poll'"),
+    ],
+    ids=["error_status", "timeout", "unknown_content_type"],
+)
+async def test_get_topics_bulk_keeps_other_topics_when_one_fails(
+    mock_client: AsyncMock, exc: Exception, reason: str
+) -> None:
+    async def detail(content_type: str, topic_id: int) -> dict[str, str]:
+        if topic_id == 2:
+            raise exc
+        return {"id": str(topic_id)}
 
-    with patch.object(server_module, "_client", mock):
-        result = json.loads(await list_topics_by_category(category_id=3))
+    mock_client.get_topic_detail.side_effect = detail
+    mock_client.try_get_topic_replies.return_value = {"result": []}
+    for topic_id in (1, 2, 3):
+        server_module._remember_topic_type(topic_id, "question")
 
-    assert result["result"][0]["title"] == "In category"
-    mock.list_topics_by_category.assert_called_once_with(3, {})
+    result = loads(await get_topics_bulk(topic_ids=[1, 2, 3]))
 
+    assert result["result"] == [
+        {"id": "1", "replies": {"result": []}},
+        {"id": 2, "error": f"Failed to fetch topic 2: {reason}"},
+        {"id": "3", "replies": {"result": []}},
+    ]
 
-async def test_list_topics_by_category_with_filters() -> None:
-    mock = _make_client_mock()
-    mock.list_topics_by_category.return_value = {"result": []}
 
-    with patch.object(server_module, "_client", mock):
-        await list_topics_by_category(
-            category_id=3, tags="api", sort="createdAt", page_size=10
-        )
+async def test_get_topics_bulk_rejects_too_many_ids(mock_client: AsyncMock) -> None:
+    topic_ids = list(range(server_module._BULK_MAX_TOPICS + 1))
 
-    call_args = mock.list_topics_by_category.call_args
-    assert call_args[0][0] == 3
-    params = call_args[0][1]
-    assert params["tags"] == "api"
-    assert params["sort"] == "createdAt"
-    assert params["pageSize"] == 10
+    result = loads(await get_topics_bulk(topic_ids=topic_ids))
 
+    assert "Too many topic IDs" in result["error"]
+    assert mock_client.method_calls == []
 
-async def test_list_topics_by_category_with_date_filters() -> None:
-    mock = _make_client_mock()
-    mock.list_topics_by_category.return_value = {"result": []}
 
-    with patch.object(server_module, "_client", mock):
-        await list_topics_by_category(
-            category_id=3, created_after="2024-01-01", created_before="2024-12-31"
-        )
+async def test_get_topics_bulk_limits_concurrency(
+    mock_client: AsyncMock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(server_module, "_BULK_CONCURRENCY", 2)
+    in_flight = peak = 0
 
-    params = mock.list_topics_by_category.call_args[0][1]
-    created = json.loads(params["createdAt"])
-    assert created == {"from": "2024-01-01", "to": "2024-12-31"}
+    async def detail(content_type: str, topic_id: int) -> dict[str, str]:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return {"id": str(topic_id)}
 
+    mock_client.get_topic_detail.side_effect = detail
+    mock_client.try_get_topic_replies.return_value = {"result": []}
+    for topic_id in range(6):
+        server_module._remember_topic_type(topic_id, "idea")
 
-# ---- list_idea_statuses ----
+    await get_topics_bulk(topic_ids=list(range(6)))
 
+    assert peak == 2
+    mock_client.get_topic_by_id.assert_not_called()
 
-async def test_list_idea_statuses_tool() -> None:
-    mock = _make_client_mock()
-    mock.list_idea_statuses.return_value = {
-        "result": [{"id": "1", "name": "Planned"}]
-    }
 
-    with patch.object(server_module, "_client", mock):
-        result = json.loads(await list_idea_statuses())
+# ---- list_categories ----
 
-    assert result["result"][0]["name"] == "Planned"
-    mock.list_idea_statuses.assert_called_once()
 
+async def test_discovery_tools_cache_serialised_output(mock_client: AsyncMock) -> None:
+    mock_client.list_categories.return_value = {"result": [{"id": "1"}]}
+    mock_client.get_category.return_value = {"id": "5"}
 
-# ---- list_product_areas ----
+    first = await list_categories()
+    second = await list_categories()
+    await get_category(category_id=5)
+    await get_category(category_id=5)
+    await get_category(category_id=6)
 
+    assert first == second
+    mock_client.list_categories.assert_called_once()
+    assert mock_client.get_category.call_count == 2
 
-async def test_list_product_areas_tool() -> None:
-    mock = _make_client_mock()
-    mock.list_product_areas.return_value = {
-        "result": [{"id": "1", "name": "Platform"}]
-    }
 
-    with patch.object(server_module, "_client", mock):
-        result = json.loads(await list_product_areas())
+# ---- list_tags ----
 
-    assert result["result"][0]["name"] == "Platform"
-    mock.list_product_areas.assert_called_once()
 
+async def test_list_tags_with_pagination(mock_client: AsyncMock) -> None:
+    mock_client.list_tags.return_value = {"result": []}
 
-# ---- get_poll_results ----
+    await list_tags(page=2, page_size=10)
 
+    mock_client.list_tags.assert_called_once_with({"page": 2, "pageSize": 10}, cache=False)
 
-async def test_get_poll_results_tool() -> None:
-    mock = _make_client_mock()
-    mock.get_poll_results.return_value = {
-        "title": "Best feature?",
-        "votes": [{"option": "Search", "count": 15}],
+
+# ---- community_overview ----
+
+
+async def test_community_overview_tool(mock_client: AsyncMock) -> None:
+    mock_client.list_categories.return_value = {"result": [{"id": "1", "name": "General"}]}
+    mock_client.get_category_tree.return_value = {"result": [{"id": "1", "children": []}]}
+    mock_client.get_category_topic_counts.return_value = {
+        "result": [{"categoryId": "1", "count": 42}]
     }
 
-    with patch.object(server_module, "_client", mock):
-        result = json.loads(await get_poll_results(topic_id=7, content_type="question"))
+    result = loads(await community_overview())
+
+    assert result["categories"]["result"][0]["name"] == "General"
+    assert result["category_tree"]["result"][0]["children"] == []
+    assert result["topic_counts"]["result"][0]["count"] == 42
+    mock_client.list_categories.assert_called_once()
+    mock_client.get_category_tree.assert_called_once()
+    mock_client.get_category_topic_counts.assert_called_once()
 
-    assert result["title"] == "Best feature?"
-    mock.get_poll_results.assert_called_once_with("question", 7)
 
+# ---- list_topics_by_category ----
 
-# ---- get_reply ----
 
+_EXPECTED_CATEGORY_TOPIC_FILTERS = {"tags": "api", "sort": "createdAt", "pageSize": 10}
 
-async def test_get_reply_tool() -> None:
-    mock = _make_client_mock()
-    mock.get_reply.return_value = {"id": "200", "content": "Helpful answer"}
 
-    with patch.object(server_module, "_client", mock):
-        result = json.loads(
-            await get_reply(topic_id=5, reply_id=200, content_type="article")
-        )
+async def test_list_topics_by_category_with_filters(mock_client: AsyncMock) -> None:
+    mock_client.list_topics_by_category.return_value = {"result": []}
 
-    assert result["id"] == "200"
-    assert result["content"] == "Helpful answer"
-    mock.get_reply.assert_called_once_with("article", 5, 200)
+    await list_topics_by_category(
+        category_id=3, tags="api", sort="createdAt", page_size=10
+    )
 
+    mock_client.list_topics_by_category.assert_called_once_with(
+        3, _EXPECTED_CATEGORY_TOPIC_FILTERS
+    )
 
-# ---- get_community_info ----
 
+async def test_list_topics_by_category_with_date_filters(mock_client: AsyncMock) -> None:
+    mock_client.list_topics_by_category.return_value = {"result": []}
 
-# ---- URL resolution in search_community ----
+    await list_topics_by_category(
+        category_id=3, created_after="2024-01-01", created_before="2024-12-31"
+    )
 
+    mock_client.list_topics_by_category.assert_called_once_with(
+        3, {"createdAt": '{"from":"2024-01-01","to":"2024-12-31"}'}
+    )
 
-async def test_search_community_resolves_relative_urls() -> None:
-    mock = _make_client_mock()
-    mock.community_url = "https://community.example.com"
-    mock.search.return_value = {
-        "community": [
-            {"id": "1", "url": "/topic/show?tid=586&fid=37"},
-            {"id": "2", "url": "https://other.example.com/page"},
-        ]
+
+async def test_list_topics_by_category_prefetch_pages(mock_client: AsyncMock) -> None:
+    mock_client.list_topics_by_category.side_effect = lambda category_id, params: {
+        "result": [{"id": f"{category_id}-{params['page']}"}]
     }
 
-    with patch.object(server_module, "_client", mock):
-        result = json.loads(await search_community(query="test"))
+    result = loads(
+        await list_topics_by_category(category_id=3, prefetch_pages=3)
+    )
 
-    assert result["community"][0]["url"] == "https://community.example.com/topic/show?tid=586&fid=37"
-    # Absolute URLs should not be modified
-    assert result["community"][1]["url"] == "https://other.example.com/page"
+    assert [t["id"] for t in result["result"]] == ["3-1", "3-2", "3-3"]
 
 
-async def test_search_community_no_resolution_without_community_url() -> None:
-    mock = _make_client_mock()
-    mock.community_url = None
-    mock.search.return_value = {
+# ---- get_poll_results ----
+
+
+@pytest.mark.parametrize(
+    "call",
+    [
+        lambda: get_poll_results(topic_id=7, content_type="poll"),
+        lambda: get_reply(topic_id=5, reply_id=200, content_type="comment"),
+        lambda: get_topic(topic_id=42, content_type="thread"),
+    ],
+    ids=["get_poll_results", "get_reply", "get_topic"],
+)
+async def test_invalid_content_type_returns_error(
+    mock_client: AsyncMock,
+    call: Callable[[], Awaitable[str]],
+) -> None:
+    result = loads(await call())
+
+    assert "Unknown content type" in result["error"]
+    assert mock_client.method_calls == []
+
+
+# ---- URL resolution ----
+
+
+@pytest.mark.parametrize(
+    ("community_url", "data", "expected"),
+    [
+        (
+            "https://community.example.com",
+            {"url": "/topic/show?tid=586&fid=37"},
+            {"url": "https://community.example.com/topic/show?tid=586&fid=37"},
+        ),
+        # Trailing slash on community_url is not doubled
+        (
+            "https://community.example.com/",
+            {"seoCommunityUrl": "/support-37/what-is-ai-answers-42"},
+            {"seoCommunityUrl": "https://community.example.com/support-37/what-is-ai-answers-42"},
+        ),
+        # Absolute URLs are left alone
+        (
+            "https://community.example.com",
+            {"url": "https://other.example.com/page"},
+            {"url": "https://other.example.com/page"},
+        ),
+        # Only URL keys are rewritten
+        (
+            "https://community.example.com",
+            {"title": "/not-a-url", "url": None},
+            {"title": "/not-a-url", "url": None},
+        ),
+        # Nested dicts and lists are walked
+        (
+            "https://community.example.com",
+            {"community": [{"id": "1", "replies": {"result": [{"url": "/reply/1"}]}}]},
+            {"community": [{"id": "1", "replies": {"result": [{"url": "https://community.example.com/reply/1"}]}}]},
+        ),
+    ],
+)
+def test_resolve_urls(community_url: str, data: Any, expected: Any) -> None:
+    assert server_module._resolve_urls(data, community_url) == expected
+
+
+async def test_search_community_no_resolution_without_community_url(mock_client: AsyncMock) -> None:
+    mock_client.community_url = None
+    mock_client.search.return_value = {
         "community": [{"id": "1", "url": "/topic/show?tid=1"}]
     }
 
-    with patch.object(server_module, "_client", mock):
-        result = json.loads(await search_community(query="test"))
+    result = loads(await search_community(query="test"))
 
     # Relative URL should remain unchanged
     assert result["community"][0]["url"] == "/topic/show?tid=1"
@@ -499,24 +865,22 @@ async def test_search_community_no_resolution_without_community_url() -> None:
 # ---- URL resolution in get_topic ----
 
 
-async def test_get_topic_resolves_relative_urls() -> None:
-    mock = _make_client_mock()
-    mock.community_url = "https://community.example.com/"
-    mock.get_topic_by_id.return_value = {
-        "result": [{"id": "42", "contentType": "question"}]
-    }
-    mock.get_topic_detail.return_value = {
-        "id": "42",
-        "url": "/topic/show?tid=42",
-        "seoCommunityUrl": "/support-37/what-is-ai-answers-42",
-        "contentType": "question",
-    }
-    mock.get_topic_replies.return_value = {
-        "result": [{"id": "100", "url": "/reply/100"}],
-    }
+async def test_get_topic_resolves_relative_urls(mock_client: AsyncMock) -> None:
+    mock_client.community_url = "https://community.example.com/"
+    _mock_topic(
+        mock_client,
+        42,
+        "question",
+        detail={
+            "id": "42",
+            "url": "/topic/show?tid=42",
+            "seoCommunityUrl": "/support-37/what-is-ai-answers-42",
+            "contentType": "question",
+        },
+        replies={"result": [{"id": "100", "url": "/reply/100"}]},
+    )
 
-    with patch.object(server_module, "_client", mock):
-        result = json.loads(await get_topic(topic_id=42))
+    result = loads(await get_topic(topic_id=42))
 
     # Trailing slash on community_url should be handled
     assert result["url"] == "https://community.example.com/topic/show?tid=42"
@@ -527,29 +891,32 @@ async def test_get_topic_resolves_relative_urls() -> None:
 # ---- get_community_info ----
 
 
-async def test_get_community_info_with_url() -> None:
-    mock = _make_client_mock()
-    mock.region = "eu-west-1"
-    mock.base_url = "https://api2-eu-west-1.insided.com"
-    mock.community_url = "https://community.example.com"
+@pytest.mark.parametrize(
+    ("region", "community_url"),
+    [("eu-west-1", "https://community.example.com"), ("us-west-2", None)],
+    ids=["with_url", "without_url"],
+)
+async def test_get_community_info(
+    mock_client: AsyncMock, region: str, community_url: str | None
+) -> None:
+    mock_client.region = region
+    mock_client.base_url = f"https://api2-{region}.insided.com"
+    mock_client.community_url = community_url
 
-    with patch.object(server_module, "_client", mock):
-        result = json.loads(await get_community_info())
+    result = loads(await get_community_info())
 
-    assert result["region"] == "eu-west-1"
-    assert result["api_base_url"] == "https://api2-eu-west-1.insided.com"
-    assert result["community_url"] == "https://community.example.com"
+    expected = {"region": region, "api_base_url": f"https://api2-{region}.insided.com"}
+    if community_url is not None:
+        expected["community_url"] = community_url
+    assert result == expected
 
 
-async def test_get_community_info_without_url() -> None:
-    mock = _make_client_mock()
-    mock.region = "us-west-2"
-    mock.base_url = "https://api2-us-west-2.insided.com"
-    mock.community_url = None
+async def test_get_community_info_built_once_per_client(mock_client: AsyncMock) -> None:
+    mock_client.region = "eu-west-1"
+    mock_client.base_url = "https://api2-eu-west-1.insided.com"
 
-    with patch.object(server_module, "_client", mock):
-        result = json.loads(await get_community_info())
+    first = await get_community_info()
+    mock_client.region = "changed"
+    second = await get_community_info()
 
-    assert result["region"] == "us-west-2"
-    assert result["api_base_url"] == "https://api2-us-west-2.insided.com"
-    assert "community_url" not in result
+    assert first is second